@@ -2,7 +2,9 @@
 """python 2-3 compatability layer. The bulk of this was borrowed from
 kennethreitz's requests module
 """
+import ssl
 import sys
+import time
 from datetime import datetime
 
 # -------
@@ -32,17 +34,35 @@ if is_py2:
         except ImportError:
             raise ex
     from httplib import (HTTPConnection, HTTPSConnection,
-                         HTTPException)
+                         HTTPException, BadStatusLine)
     from urllib import urlencode, pathname2url
 
     string_types = (str, unicode)  # NOQA
 
+    # Python 2 has no monotonic clock in the standard library
+    monotonic = time.time
+
+    # Errors raised when the server has closed an idle keep-alive connection
+    stale_connection_errors = (BadStatusLine,)
+
     def prepare_to_send(args):
         return bytes(args)
 
+    def tls_context():
+        """TLS sessions can not be resumed on Python 2, so connections use
+        the default context
+        """
+        return None
+
     def prepare_for_loads(body, encoding):
         return body
 
+    def intern_str(s):
+        """Intern *s* if it is a byte string, Python 2 can not intern unicode
+        objects so those are returned unchanged
+        """
+        return intern(s) if isinstance(s, str) else s  # NOQA
+
     def force_unicode(s, encoding='UTF-8'):
         try:
             s = unicode(s)  # NOQA
@@ -74,18 +94,51 @@ if is_py2:
 
 elif is_py3:
     from http.client import (HTTPConnection, HTTPSConnection,  # NOQA
-                             HTTPException)  # NOQA
+                             HTTPException, BadStatusLine)  # NOQA
     from urllib.parse import urlencode  # NOQA
     from urllib.request import pathname2url  # NOQA
     import json  # NOQA
     string_types = (str,)
+    monotonic = time.monotonic
+
+    # Errors raised when the server has closed an idle keep-alive connection
+    stale_connection_errors = (BadStatusLine, ConnectionResetError,
+                               BrokenPipeError)
 
     def prepare_to_send(args):
+        if isinstance(args, bytes):
+            return args
         return bytes(args, 'UTF-8')
 
+    if hasattr(ssl, 'SSLSession'):
+        def tls_context():
+            """Return a new context for connections which should resume their
+            previous TLS session when reopened. It is made by
+            ``ssl._create_default_https_context``, and set up the same way as
+            the context :mod:`http.client` makes for each connection, so
+            overrides of that function and SSLKEYLOGFILE still apply
+            """
+            context = ssl._create_default_https_context()
+            if ssl.HAS_ALPN:
+                context.set_alpn_protocols(['http/1.1'])
+            if getattr(context, 'post_handshake_auth', None) is not None:
+                context.post_handshake_auth = True
+            return context
+    else:
+        def tls_context():
+            """This Python can not resume TLS sessions, so connections use
+            the default context
+            """
+            return None
+
     def prepare_for_loads(body, encoding):
         return body.decode(encoding)
 
+    def intern_str(s):
+        """Intern *s* if it is a string, returning any other value unchanged
+        """
+        return sys.intern(s) if isinstance(s, str) else s
+
     def force_unicode(s, encoding='UTF-8'):
         return str(s)
 
@@ -107,3 +160,37 @@ elif is_py3:
         if date_string[-3] != ':':
             date_string = date_string[:-2] + ':' + date_string[-2:]
         return date_string
+
+# ---------------
+# JSON Encoding
+# ---------------
+
+# orjson, or failing that ujson, are optional and significantly faster JSON
+# libraries. When neither is installed we fall back to the json module
+# selected above
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson is not None:
+    def json_dumps(obj):
+        """Serialize *obj* to a UTF-8 encoded JSON ``bytes`` object"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    json_loads = orjson.loads
+elif ujson is not None:
+    json_dumps = ujson.dumps
+    json_loads = ujson.loads
+else:
+    json_dumps = json.dumps
+
+    def json_loads(s):
+        """Deserialize *s*, a JSON document as text or UTF-8 encoded bytes"""
+        if is_py3 and isinstance(s, bytes):
+            s = s.decode('UTF-8')
+        return json.loads(s)
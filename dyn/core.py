@@ -5,17 +5,21 @@ library, it is not recommened and could possible result in some strange
 behavior.
 """
 import base64
-import copy
 import locale
 import logging
+import random
 import re
 import threading
 import time
 from datetime import datetime
 
 from . import __version__
-from .compat import (HTTPConnection, HTTPSConnection, HTTPException, json,
-                     prepare_to_send, force_unicode)
+from .compat import (HTTPConnection, HTTPSConnection, HTTPException,
+                     json_dumps, json_loads, prepare_to_send, force_unicode,
+                     monotonic, stale_connection_errors, tls_context)
+
+# The encoded body of a request without any arguments
+_EMPTY_BODY = b'{}'
 
 
 def cleared_class_dict(dict_obj):
@@ -32,7 +36,8 @@ def clean_args(dict_obj):
 
     :param dict_obj: The dictionary of arguments to be cleaned
     """
-    cleaned_args = copy.deepcopy(dict_obj)
+    # Only the top level password is masked, so a shallow copy is enough
+    cleaned_args = dict(dict_obj)
     if 'password' in cleaned_args:
         cleaned_args['password'] = '*****'
     return cleaned_args
@@ -40,20 +45,21 @@ def clean_args(dict_obj):
 
 class _Singleton(type):
     _instances = {}
+    # Guards changes to _instances, lookups are left unlocked
+    _instances_lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         cur_thread = threading.current_thread()
         key = getattr(cls, '__metakey__')
-        if key not in cls._instances:
-            cls._instances[key] = {
-                # super(Singleton, cls) evaluates to type; *args/**kwargs get
-                # passed to class __init__ method via type.__call__
-                cur_thread: super(_Singleton, cls).__call__(*args, **kwargs)
-            }
-        elif key in cls._instances and cur_thread not in cls._instances[key]:
-            cls._instances[key][cur_thread] = \
-                super(_Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[key][cur_thread]
+        instance = cls._instances.get(key, {}).get(cur_thread)
+        if instance is None:
+            # super(Singleton, cls) evaluates to type; *args/**kwargs get
+            # passed to class __init__ method via type.__call__. The lock is
+            # not held while the new session connects and authenticates
+            instance = super(_Singleton, cls).__call__(*args, **kwargs)
+            with cls._instances_lock:
+                cls._instances.setdefault(key, {})[cur_thread] = instance
+        return instance
 
 
 # This class is a workaround for supporting metaclasses in both Python2 and 3
@@ -64,6 +70,38 @@ class Singleton(_Singleton('SingletonMeta', (object,), {})):
     pass
 
 
+class _HTTPSConnection(HTTPSConnection):
+    """An :class:`HTTPSConnection` which keeps the TLS session of its socket
+    when it is closed, and offers it to the server when the connection is
+    reopened, so that the server can resume that session instead of
+    repeating the full handshake
+    """
+
+    def __init__(self, host, port, tls_context=None, **kwargs):
+        if tls_context is not None:
+            kwargs['context'] = tls_context
+        HTTPSConnection.__init__(self, host, port, **kwargs)
+        self.tls_session = None
+
+    def connect(self):
+        """Open the connection, resuming the TLS session of the previous
+        socket if there was one
+        """
+        if self.tls_session is None:
+            return HTTPSConnection.connect(self)
+        HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(self.sock,
+                                              server_hostname=server_hostname,
+                                              session=self.tls_session)
+
+    def close(self):
+        session = getattr(self.sock, 'session', None)
+        if session is not None:
+            self.tls_session = session
+        HTTPSConnection.close(self)
+
+
 class _History(list):
     """A *list* subclass specifically targeted at being able to store the
     history of calls made via a SessionEngine
@@ -79,8 +117,34 @@ class _History(list):
 
 class SessionEngine(Singleton):
     """Base object representing a DynectSession Session"""
-    _valid_methods = tuple()
+    _valid_methods = frozenset()
     uri_root = '/'
+    _NAME_FMT = force_unicode('<{}>')
+    user_agent = 'dyn-py v{}'.format(__version__)
+    #: Socket timeout, in seconds, used for connections to the API server
+    timeout = 300
+    #: Seconds a connection may sit idle before it is assumed the server has
+    #: closed it, and it is reopened before the next request
+    keep_alive_timeout = 60
+    #: HTTP statuses returned while the API is briefly unavailable, requests
+    #: answered with one of them are sent again after a backoff
+    retry_statuses = frozenset((502, 503, 504))
+    #: Idempotent methods, which are resent for :attr:`retry_statuses` or
+    #: when the connection drops after the request went out. POST is left
+    #: out, as the API may already have acted on the request
+    retry_methods = frozenset(('GET', 'PUT', 'DELETE'))
+    #: Maximum number of times a request is resent for one of those statuses
+    status_retries = 3
+    #: Seconds waited before the first resend, doubling on each one after it
+    retry_backoff = 0.5
+    #: Maximum number of validated uris remembered by :meth:`_validate_uri`
+    uri_cache_size = 1024
+    # Decodes response bodies, given as bytes. The fastest JSON library
+    # installed is used, subclasses may replace it
+    _json_loads = staticmethod(json_loads)
+    #: Longest wait, in seconds, between polls of an incomplete job. Polling
+    #: starts after one second and the wait doubles up to this value
+    job_poll_interval = 10
 
     def __init__(self, host=None, port=443, ssl=True, history=False,
                  proxy_host=None, proxy_port=None, proxy_user=None,
@@ -114,8 +178,11 @@ class SessionEngine(Singleton):
         self.content_type = 'application/json'
         self._encoding = locale.getdefaultlocale()[-1] or 'UTF-8'
         self._token = self._conn = self._last_response = None
+        self._last_request = self._tls_context = None
+        self._request_sent = False
         self._permissions = None
         self._tasks = {}
+        self._uri_cache = {}
 
     @classmethod
     def new_session(cls, *args, **kwargs):
@@ -147,13 +214,17 @@ class SessionEngine(Singleton):
         """Remove the current session from the dict of instances and return it.
         If there was not currently a session being stored, return None. If,
         after removing this session, there is nothing under the current key,
-        delete that key's entry in the _instances dict.
+        delete that key's entry in the _instances dict. The session's
+        connection to the API server is closed.
         """
         cur_thread = threading.current_thread()
         key = getattr(cls, '__metakey__')
-        closed = cls._instances.get(key, {}).pop(cur_thread, None)
-        if len(cls._instances.get(key, {})) == 0:
-            cls._instances.pop(key, None)
+        with cls._instances_lock:
+            closed = cls._instances.get(key, {}).pop(cur_thread, None)
+            if len(cls._instances.get(key, {})) == 0:
+                cls._instances.pop(key, None)
+        if closed is not None and closed._conn is not None:
+            closed._conn.close()
         return closed
 
     @property
@@ -174,59 +245,37 @@ class SessionEngine(Singleton):
             self.poll_incomplete = orig_value
             self._token = None
         self._conn = None
-        use_proxy = False
-        headers = {}
 
         if self.proxy_host and not self.proxy_port:
             msg = 'Proxy missing port, please specify a port'
             raise ValueError(msg)
 
-        if self.proxy_host and self.proxy_port:
-            use_proxy = True
+        kind = 'SSL' if self.ssl else 'unencrypted'
+        if self.proxy_host:
+            self.logger.info('Establishing %s connection to %s:%s with proxy '
+                             '%s:%s', kind, self.host, self.port,
+                             self.proxy_host, self.proxy_port)
+            host, port = self.proxy_host, self.proxy_port
+        else:
+            self.logger.info('Establishing %s connection to %s:%s', kind,
+                             self.host, self.port)
+            host, port = self.host, self.port
+
+        if self.ssl:
+            if self._tls_context is None:
+                self._tls_context = tls_context()
+            self._conn = _HTTPSConnection(host, port, timeout=self.timeout,
+                                          tls_context=self._tls_context)
+        else:
+            self._conn = HTTPConnection(host, port, timeout=self.timeout)
 
+        if self.proxy_host:
+            headers = {}
             if self.proxy_user and self.proxy_pass:
-                auth = '{}:{}'.format(self.proxy_user, self.proxy_pass).encode()
-                headers['Proxy-Authorization'] = 'Basic ' + str(base64.b64encode(
-                    auth))
-
-        if use_proxy:
-            if self.ssl:
-                s = 'Establishing SSL connection to {}:{} with proxy {}:{}'
-                msg = s.format(
-                    self.host,
-                    self.port,
-                    self.proxy_host,
-                    self.proxy_port)
-                self.logger.info(msg)
-                self._conn = HTTPSConnection(self.proxy_host, self.proxy_port,
-                                             timeout=300)
-                self._conn.set_tunnel(self.host, self.port, headers)
-            else:
-                s = ('Establishing unencrypted connection to {}:{} with proxy '
-                     '{}:{}')
-                msg = s.format(
-                    self.host,
-                    self.port,
-                    self.proxy_host,
-                    self.proxy_port)
-                self.logger.info(msg)
-                self._conn = HTTPConnection(self.proxy_host, self.proxy_port,
-                                            timeout=300)
-                self._conn.set_tunnel(self.host, self.port, headers)
-        else:
-            if self.ssl:
-                msg = 'Establishing SSL connection to {}:{}'.format(self.host,
-                                                                    self.port)
-                self.logger.info(msg)
-                self._conn = HTTPSConnection(self.host, self.port,
-                                             timeout=300)
-            else:
-                msg = 'Establishing unencrypted connection to {}:{}'.format(
-                    self.host,
-                    self.port)
-                self.logger.info(msg)
-                self._conn = HTTPConnection(self.host, self.port,
-                                            timeout=300)
+                auth = '{}:{}'.format(self.proxy_user, self.proxy_pass)
+                auth = base64.b64encode(auth.encode()).decode('ascii')
+                headers['Proxy-Authorization'] = 'Basic ' + auth
+            self._conn.set_tunnel(self.host, self.port, headers)
 
     def _process_response(self, response, method, final=False):
         """API Method. Process an API response for failure, incomplete, or
@@ -245,6 +294,13 @@ class SessionEngine(Singleton):
         """
         return None
 
+    @staticmethod
+    def _jitter(wait):
+        """Return a random wait between half of *wait* and *wait*, so that
+        sessions which failed together do not all retry at the same moment
+        """
+        return wait / 2.0 + random.uniform(0, wait / 2.0)
+
     def _retry(self, msgs, final=False):
         """Retry logic around throttled or blocked tasks"""
 
@@ -252,8 +308,11 @@ class SessionEngine(Singleton):
         throttled = any(throttle_err == err['ERR_CD'] for err in msgs)
 
         if throttled:
-            # We're rate limited, so wait 5 seconds and try again
-            return dict(retry=True, wait=5, final=final)
+            # We're rate limited, so wait at least 5 seconds and try again.
+            # The wait is only ever lengthened, so that throttled sessions do
+            # not all retry together without being throttled once more
+            return dict(retry=True, wait=5 + random.uniform(0, 2.5),
+                        final=final)
 
         blocked_err = 'Operation blocked by current task'
         blocked = any(blocked_err in err['INFO'] for err in msgs)
@@ -273,15 +332,21 @@ class SessionEngine(Singleton):
                 self._tasks[task] = wait * 2 + 1
 
             # Give up if final or wait > 30 seconds
-            return dict(retry=True, wait=wait, final=wait > 30 or final)
+            return dict(retry=True, wait=self._jitter(wait),
+                        final=wait > 30 or final)
 
         # Neither blocked nor throttled?
         return dict(retry=False, wait=0, final=True)
 
-    def _handle_response(self, response, uri, method, raw_args, final):
-        """Handle the processing of the API's response"""
+    def _handle_response(self, response, uri, method, raw_args, final,
+                         args=None):
+        """Handle the processing of the API's response
+
+        :param args: The encoded arguments the request was sent with, reused
+            as is if the request has to be retried
+        """
         body = response.read()
-        self.logger.debug('RESPONSE: {0}'.format(body))
+        self.logger.debug('RESPONSE: %s', body)
         self._last_response = response
 
         if self.poll_incomplete:
@@ -294,12 +359,15 @@ class SessionEngine(Singleton):
             self.logger.error(error_message)
             raise ValueError(error_message)
 
+        # The raw body is parsed without first decoding a copy of it, and is
+        # dropped before any retries are made
         json_err_fmt = "Decode Error on Response Body: {!r} status: {!r} {!r}"
         try:
-            ret_val = json.loads(body.decode('UTF-8'))
+            ret_val = self._json_loads(body)
         except ValueError:
             self.logger.error(json_err_fmt.format(body, response.status, uri))
             raise
+        del body
 
         if self.__call_cache is not None:
             self.__call_cache.append((uri, method, clean_args(raw_args),
@@ -314,7 +382,10 @@ class SessionEngine(Singleton):
 
         if retry.get('retry', False):
             time.sleep(retry['wait'])
-            return self.execute(uri, method, raw_args, final=retry['final'])
+            if args is None:
+                return self.execute(uri, method, raw_args,
+                                    final=retry['final'])
+            return self._execute(uri, method, raw_args, args, retry['final'])
         else:
             return self._process_response(ret_val, method)
 
@@ -322,36 +393,53 @@ class SessionEngine(Singleton):
         """Validate and return a cleaned up uri. Make sure the command is
         prefixed by '/REST/'
         """
-        if not uri.startswith('/'):
-            uri = '/' + uri
+        validated = self._uri_cache.get(uri)
+        if validated is not None:
+            return validated
+
+        validated = uri
+        if not validated.startswith('/'):
+            validated = '/' + validated
 
-        if not uri.startswith(self.uri_root):
-            uri = self.uri_root + uri
+        if not validated.startswith(self.uri_root):
+            validated = self.uri_root + validated
 
-        return uri
+        if len(self._uri_cache) >= self.uri_cache_size:
+            self._uri_cache.clear()
+        self._uri_cache[uri] = validated
+        return validated
 
     def _validate_method(self, method):
         """Validate the provided HTTP method type"""
         if method.upper() not in self._valid_methods:
             msg = '{} is not a valid HTTP method. Please use one of {}'
-            msg = msg.format(method, ', '.join(self._valid_methods))
+            msg = msg.format(method, ', '.join(sorted(self._valid_methods)))
             raise ValueError(msg)
 
     def _prepare_arguments(self, args, method, uri):
         """Prepare the arguments to be sent off to the API"""
-        if args is None:
-            args = {}
-        if not isinstance(args, dict):
+        if args is None or (isinstance(args, dict) and not args):
+            # Nothing to encode, a new dict is returned as callers may add
+            # arguments to it
+            return {}, _EMPTY_BODY, uri
+        if not isinstance(args, dict) and hasattr(args, '_ARG_FIELDS'):
+            # The object names the private attributes to send, so there is no
+            # need to inspect everything in its __dict__
+            obj, args = args, {}
+            for name in obj._ARG_FIELDS:
+                val = getattr(obj, '_' + name)
+                if val is not None:
+                    args[name] = getattr(val, '_json', val)
+        elif not isinstance(args, dict):
             # If args is an object type, parse it's dict for valid args
             # If an item in args.__dict__ has a _json attribute, use that in
             # place of the actual object
-            d = args.__dict__
-            args = {(x if not x.startswith('_') else x[1:]):
-                    (d[x] if not hasattr(d[x], '_json') else getattr(d[x],
-                                                                     '_json'))
-                    for x in d if d[x] is not None and
-                    not hasattr(d[x], '__call__') and x.startswith('_')}
-        return args, json.dumps(args), uri
+            obj, args = args, {}
+            for name, val in obj.__dict__.items():
+                if val is None or callable(val) or not name.startswith('_'):
+                    continue
+                args[name[1:]] = getattr(val, '_json', val)
+        return args, json_dumps(args), uri
 
     def execute(self, uri, method, args=None, final=False):
         """Execute a commands against the rest server
@@ -373,20 +461,36 @@ class SessionEngine(Singleton):
 
         # Prepare arguments to send to API
         raw_args, args, uri = self._prepare_arguments(args, method, uri)
+        return self._execute(uri, method, raw_args, args, final)
 
-        msg = 'uri: {}, method: {}, args: {}'
-        self.logger.debug(
-            msg.format(uri, method, clean_args(json.loads(args))))
+    def _execute(self, uri, method, raw_args, args, final):
+        """Send a request whose uri has been validated and whose arguments
+        have already been encoded, and process its response
 
-        # Send the command and deal with results
-        self.send_command(uri, method, args)
+        :param uri: The validated uri of the resource to access
+        :param method: One of :attr:`_valid_methods`
+        :param raw_args: The arguments as they were before being encoded
+        :param args: The encoded arguments to send
+        :param final: boolean flag representing whether or not we have already
+            failed executing once or not
+        """
+        # Only copy the arguments for masking when they will be logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('uri: %s, method: %s, args: %s', uri, method,
+                              clean_args(raw_args))
 
-        # Deal with the results
+        # Send the command and deal with results
         try:
-            response = self._conn.getresponse()
+            response = self._request(uri, method, args)
         except (IOError, HTTPException) as e:
             if final:
                 raise e
+            if self._request_sent and \
+                    method.upper() not in self.retry_methods:
+                # The server may have acted on the request before the
+                # connection failed, so it must not be sent again
+                self._conn.close()
+                raise e
             else:
                 # Handle processing a connection error
                 resp = self._handle_error(uri, method, raw_args)
@@ -396,7 +500,8 @@ class SessionEngine(Singleton):
                     return resp
                 raise e
 
-        return self._handle_response(response, uri, method, raw_args, final)
+        return self._handle_response(response, uri, method, raw_args, final,
+                                     args)
 
     def _meta_update(self, uri, method, results):
         """Update the HTTP session token if the uri is a login or logout
@@ -425,13 +530,82 @@ class SessionEngine(Singleton):
         while response.status == 307:
             time.sleep(1)
             uri = response.getheader('Location')
-            self.logger.info('Polling {}'.format(uri))
+            self.logger.info('Polling %s', uri)
 
-            self.send_command(uri, 'GET', '')
-            response = self._conn.getresponse()
+            response = self._request(uri, 'GET', '')
             body = response.read()
         return response, body
 
+    def _request(self, uri, method, args):
+        """Send a request and return its response. Requests made with one of
+        :attr:`retry_methods` are resent with an exponential backoff while
+        the API answers with one of :attr:`retry_statuses`
+
+        :param uri: The uri of the resource to interact with
+        :param method: The HTTP method to use
+        :param args: Encoded arguments to send to the server
+        """
+        response = self._send_request(uri, method, args)
+        if method.upper() not in self.retry_methods:
+            return response
+        for attempt in range(self.status_retries):
+            if response.status not in self.retry_statuses:
+                break
+            # Drain the body so that the connection can be reused
+            response.read()
+            wait = self._jitter(self.retry_backoff * 2 ** attempt)
+            self.logger.info('Received HTTP %s, retrying in %.1f seconds',
+                             response.status, wait)
+            time.sleep(wait)
+            response = self._send_request(uri, method, args)
+        return response
+
+    def _send_request(self, uri, method, args):
+        """Send a request over the persistent connection and return its
+        response. If the server has closed the connection while it sat idle
+        between calls, reopen it and send the request once more rather than
+        treating it as a failed API call. Once the request has been sent it
+        is only sent again, here or by :meth:`_handle_error`, if its method is
+        one of :attr:`retry_methods`.
+
+        :param uri: The uri of the resource to interact with
+        :param method: The HTTP method to use
+        :param args: Encoded arguments to send to the server
+        """
+        now = monotonic()
+        if self._last_request is not None and \
+                now - self._last_request > self.keep_alive_timeout:
+            # Reopen a long idle connection up front, rather than failing to
+            # send over it first
+            self._conn.close()
+        self._last_request = now
+        self._request_sent = False
+        try:
+            self.send_command(uri, method, args)
+        except stale_connection_errors:
+            # The request never made it to the server
+            return self._resend_request(uri, method, args)
+        self._request_sent = True
+        try:
+            return self._conn.getresponse()
+        except stale_connection_errors:
+            # The server may have acted on the request before dropping the
+            # connection
+            if method.upper() not in self.retry_methods:
+                raise
+            return self._resend_request(uri, method, args)
+
+    def _resend_request(self, uri, method, args):
+        """Reopen the connection after the server closed it, and send the
+        request over the new one
+        """
+        self.logger.info('Connection closed by server, reconnecting')
+        self._conn.close()
+        self._request_sent = False
+        self.send_command(uri, method, args)
+        self._request_sent = True
+        return self._conn.getresponse()
+
     def send_command(self, uri, method, args):
         """Responsible for packaging up the API request and sending it to the
         server over the established connection
@@ -443,10 +617,9 @@ class SessionEngine(Singleton):
         self._conn.putrequest(method, uri)
 
         # Build headers
-        user_agent = 'dyn-py v{}'.format(__version__)
-        headers = {'Content-Type': self.content_type, 'User-Agent': user_agent}
-        for key, val in self.extra_headers.items():
-            headers[key] = val
+        headers = {'Content-Type': self.content_type,
+                   'User-Agent': self.user_agent, 'Connection': 'keep-alive'}
+        headers.update(self.extra_headers)
 
         if self._token is not None:
             headers['Auth-Token'] = self._token
@@ -455,10 +628,11 @@ class SessionEngine(Singleton):
             self._conn.putheader(key, val)
 
         # Now the arguments
-        self._conn.putheader('Content-length', '%d' % len(args))
+        body = prepare_to_send(args)
+        self._conn.putheader('Content-length', '%d' % len(body))
         self._conn.endheaders()
 
-        self._conn.send(prepare_to_send(args))
+        self._conn.send(body)
 
     def wait_for_job_to_complete(self, job_id, timeout=120):
         """When a response comes back with a status of "incomplete" we need to
@@ -469,18 +643,16 @@ class SessionEngine(Singleton):
         :param timeout: how long (in seconds) we should wait for a valid
             response before giving up on this request
         """
-        self.logger.debug('Polling for job_id: {}'.format(job_id))
-        start = datetime.now()
+        self.logger.debug('Polling for job_id: %s', job_id)
+        deadline = monotonic() + timeout
         uri = '/Job/{}/'.format(job_id)
-        api_args = {}
-        # response = self.execute(uri, 'GET', api_args)
-        response = {'status': 'incomplete'}
-        now = datetime.now()
-        self.logger.warn('Waiting for job {}'.format(job_id))
-        too_long = (now - start).seconds < timeout
-        while response['status'] is 'incomplete' and too_long:
-            time.sleep(10)
-            response = self.execute(uri, 'GET', api_args)
+        self.logger.warn('Waiting for job %s', job_id)
+        response = self.execute(uri, 'GET')
+        wait = 1
+        while response['status'] == 'incomplete' and monotonic() < deadline:
+            time.sleep(wait)
+            wait = min(wait * 2, self.job_poll_interval)
+            response = self.execute(uri, 'GET')
         return response
 
     def __getstate__(cls):
@@ -489,6 +661,7 @@ class SessionEngine(Singleton):
         """
         d = cls.__dict__.copy()
         d.pop('_conn')
+        d.pop('_tls_context', None)
         return d
 
     def __setstate__(cls, state):
@@ -497,11 +670,14 @@ class SessionEngine(Singleton):
         handle rebuilding it later
         """
         cls.__dict__ = state
-        cls.__dict__['_conn'] = None
+        cls.__dict__['_conn'] = cls.__dict__['_last_request'] = None
+        cls.__dict__['_tls_context'] = None
+        cls.__dict__['_request_sent'] = False
+        cls.__dict__.setdefault('_uri_cache', {})
 
     def __str__(self):
         """str override"""
-        return force_unicode('<{}>').format(self.name)
+        return self._NAME_FMT.format(self.name)
 
     __repr__ = __unicode__ = __str__
 
@@ -2,11 +2,14 @@
 """Encryption module for providing users an option to not store their DynECT
 DNS passwords in plain-text, but rather to provide a means of automatic
 password encryption. Note: password encryption requires nothing more than the
-installation of the `PyCrypto <http://www.dlitz.net/software/pycrypto/>`_.
-module. Users are free to not install PyCrypto, however, your passwords will
-not be encrypted when stored in your session instance
+installation of either the `cryptography <https://cryptography.io/>`_ or the
+`PyCrypto <http://www.dlitz.net/software/pycrypto/>`_ module. cryptography is
+preferred when both are installed, as it uses OpenSSL's AES implementation.
+Users are free to install neither, however, your passwords will not be
+encrypted when stored in your session instance
 """
 import base64
+import os
 import random
 import hashlib
 
@@ -34,10 +37,73 @@ def generate_key(force=False):
 generate_key.secret_key = None
 
 
+try:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import (Cipher, algorithms,
+                                                        modes)
+except ImportError:
+    Cipher = None
+
 try:
     from Crypto import Random
     from Crypto.Cipher import AES
+except ImportError:
+    AES = None
+
+if Cipher is not None:
+    class AESCipher(object):
+        """An AES-256 password hasher"""
+        iv_size = algorithms.AES.block_size // 8
+
+        def __init__(self, key=None):
+            """Create a new AES-256 Cipher instance
+
+            :param key: The secret key used to generate the password hashes
+            """
+            self.bs = 32
+            if key is None:
+                key = generate_key()
+            self.key = hashlib.sha256(key.encode()).digest()
+            self._algorithm = algorithms.AES(self.key)
+            self._backend = default_backend()
+
+        def encrypt(self, raw):
+            """Encrypt the provided password and return the encoded password
+            hash
+
+            :param raw: The raw password string to encode
+            """
+            if not isinstance(raw, bytes):
+                raw = raw.encode('utf-8')
+            iv = os.urandom(self.iv_size)
+            encryptor = self._cipher(iv).encryptor()
+            enc = encryptor.update(self._pad(raw)) + encryptor.finalize()
+            return base64.b64encode(iv + enc)
+
+        def decrypt(self, enc):
+            """Decrypt an encoded password hash using the secret key provided,
+            and return the decrypted string
+
+            :param enc: The encoded AES-256 password hash
+            """
+            enc = base64.b64decode(enc)
+            decryptor = self._cipher(enc[:self.iv_size]).decryptor()
+            raw = decryptor.update(enc[self.iv_size:]) + decryptor.finalize()
+            return self._unpad(raw).decode('utf-8')
+
+        def _cipher(self, iv):
+            return Cipher(self._algorithm, modes.CBC(iv),
+                          backend=self._backend)
+
+        def _pad(self, s):
+            pad = self.bs - len(s) % self.bs
+            return s + bytes(bytearray((pad,)) * pad)
 
+        @staticmethod
+        def _unpad(s):
+            return s[:-ord(s[len(s) - 1:])]
+
+elif AES is not None:
     class AESCipher(object):
         """An AES-256 password hasher"""
         def __init__(self, key=None):
@@ -49,6 +115,7 @@ try:
             if key is None:
                 key = generate_key()
             self.key = hashlib.sha256(key.encode()).digest()
+            self._rng = Random.new()
 
         def encrypt(self, raw):
             """Encrypt the provided password and return the encoded password
@@ -58,7 +125,7 @@ try:
             """
             raw = self._pad(raw)
             Random.atfork()
-            iv = Random.new().read(AES.block_size)
+            iv = self._rng.read(AES.block_size)
             cipher = AES.new(self.key, AES.MODE_CBC, iv)
             return base64.b64encode(iv + cipher.encrypt(raw))
 
@@ -82,8 +149,9 @@ try:
         def _unpad(s):
             return s[:-ord(s[len(s) - 1:])]
 
-except ImportError:
-    # If we don't have PyCrypto installed, we won't encrypt passwords
+else:
+    # If we don't have cryptography or PyCrypto installed, we won't encrypt
+    # passwords
     class AESCipher(object):
         """An AES-256 password hasher"""
         def __init__(self, key=None):
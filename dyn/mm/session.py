@@ -7,7 +7,7 @@ own respective functionality.
 import locale
 # API Libs
 from dyn.core import SessionEngine
-from dyn.compat import urlencode, pathname2url, json, prepare_for_loads
+from dyn.compat import urlencode, pathname2url
 from dyn.mm.errors import (EmailKeyError, EmailInvalidArgumentError,
                            EmailObjectError)
 
@@ -17,8 +17,11 @@ __author__ = 'jnappi'
 class MMSession(SessionEngine):
     """Base object representing a Message Management API Session"""
     __metakey__ = 'a577c742-6dce-49ae-9b1f-dce6477fa646'
-    _valid_methods = ('GET', 'POST')
+    _valid_methods = frozenset(('GET', 'POST'))
     uri_root = '/rest/json'
+    #: The error raised for a failed call, by API status code
+    _FAILURE_EXC = {451: EmailKeyError, 452: EmailInvalidArgumentError,
+                    453: EmailObjectError}
 
     def __init__(self, apikey, host='emailapi.dynect.net', port=443, ssl=True,
                  proxy_host=None, proxy_port=None, proxy_user=None,
@@ -61,10 +64,12 @@ class MMSession(SessionEngine):
             return {}, '{}', uri
         return args, urlencode(args), uri
 
-    def _handle_response(self, response, uri, method, raw_args, final):
+    def _handle_response(self, response, uri, method, raw_args, final,
+                         args=None):
         """Handle the processing of the API's response"""
-        body = response.read()
-        ret_val = json.loads(prepare_for_loads(body, self._encoding))
+        # JSON is UTF-8, so the body is parsed as is instead of first being
+        # decoded into a second copy using the locale's encoding
+        ret_val = self._json_loads(response.read())
         return self._process_response(ret_val['response'], method, final)
 
     def _process_response(self, response, method, final=False):
@@ -78,9 +83,6 @@ class MMSession(SessionEngine):
         self.logger.debug(status)
         if status == 200:
             return response['data']
-        elif status == 451:
-            raise EmailKeyError(reason)
-        elif status == 452:
-            raise EmailInvalidArgumentError(reason)
-        elif status == 453:
-            raise EmailObjectError(reason)
+        exc = self._FAILURE_EXC.get(status)
+        if exc is not None:
+            raise exc(reason)
@@ -1286,6 +1286,9 @@ class UserZone(object):
 
 class Notifier(object):
     """DynECT System Notifier"""
+    # The private attributes sent as arguments when this object is passed to
+    # SessionEngine.execute
+    _ARG_FIELDS = ('label', 'recipients', 'services', 'notifier_id')
 
     def __init__(self, *args, **kwargs):
         """Create a new :class:`~dyn.tm.accounts.Notifier` object
@@ -1411,6 +1414,12 @@ class Notifier(object):
 
 class Contact(object):
     """A DynECT System Contact"""
+    # The private attributes sent as arguments when this object is passed to
+    # SessionEngine.execute
+    _ARG_FIELDS = ('nickname', 'email', 'first_name', 'last_name',
+                   'organization', 'address', 'address_2', 'city', 'country',
+                   'fax', 'notify_email', 'pager_email', 'phone', 'post_code',
+                   'state', 'website')
 
     def __init__(self, nickname, *args, **kwargs):
         """Create a :class:`~dyn.tm.accounts.Contact` object
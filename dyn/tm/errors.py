@@ -20,7 +20,10 @@ class DynectError(Exception):
         """
         super(DynectError, self).__init__()
         self.message = ''
+        #: The messages from the API response, when the error came from one
+        self.messages = []
         if isinstance(json_response_messages, list):
+            self.messages = json_response_messages
             for message in json_response_messages:
                 self.message += '{}. '.format(message['INFO'])
             if self.message == '':
@@ -62,6 +65,8 @@ class DynectInvalidArgumentError(DynectError):
         """
         super(DynectInvalidArgumentError, self).__init__({})
         self.message = 'Invalid argument ({}, {})'.format(arg, value)
+        if isinstance(valid_args, (set, frozenset)):
+            valid_args = tuple(sorted(valid_args))
         if valid_args is not None:
             self.message += ' :: valid values are: {}'.format(valid_args)
 
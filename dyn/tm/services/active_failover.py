@@ -60,20 +60,6 @@ class HealthMonitor(object):
                 json_blob[key[1:]] = val
         return json_blob
 
-    def __eq__(self, other):
-        """eq override for comparing :class:`HealthMonitor` objects to JSON
-        response hashes or other :class:`DNSSECKey` instances
-
-        :param other: the value to compare this :class:`HealthMonitor` to.
-            Valid input types: `dict`, :class:`HealthMonitor`
-        """
-        if isinstance(other, dict):
-            return False
-        elif isinstance(other, HealthMonitor):
-            return False
-        else:
-            return False
-
     @property
     def status(self):
         """Get the current status of this :class:`HealthMonitor` from the
@@ -380,7 +366,7 @@ class ActiveFailover(object):
         """:class:`Task` for most recent system action
         on this :class:`ActiveFailover`."""
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     @property
@@ -60,20 +60,6 @@ class Monitor(object):
                 json_blob[key[1:]] = val
         return json_blob
 
-    def __eq__(self, other):
-        """eq override for comparing :class:`HealthMonitor` objects to JSON
-        response hashes or other :class:`HealthMonitor` instances
-
-        :param other: the value to compare this :class:`HealthMonitor` to.
-            Valid input types: `dict`, :class:`HealthMonitor`
-        """
-        if isinstance(other, dict):
-            return False
-        elif isinstance(other, Monitor):
-            return False
-        else:
-            return False
-
     @property
     def status(self):
         """Get the current status of this :class:`HealthMonitor` from the
@@ -307,7 +293,7 @@ class GSLBRegionPoolEntry(object):
         """:class:`Task` for most recent system
         action on this :class:`ActiveFailover`."""
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     def sync(self):
@@ -542,7 +528,7 @@ class GSLBRegion(object):
         """:class:`Task` for most recent system
         action on this :class:`ActiveFailover`."""
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     def sync(self):
@@ -655,6 +641,28 @@ class GSLBRegion(object):
         return bytes(self.__str__())
 
 
+def _api_field(key, doc, valid=None, fetch=False):
+    """Return a property exposing the :class:`GSLB` field *key*. Assignments
+    are validated and sent to the DynECT System via :meth:`GSLB._api_set`.
+
+    :param key: The name of this field in the DynECT API
+    :param doc: The docstring for the generated property
+    :param valid: The name of the ``valid_*`` attribute to validate against
+    :param fetch: Whether reads should refresh this :class:`GSLB` first
+    """
+    attr = '_' + key
+
+    def fget(self):
+        if fetch:
+            self._get()
+        return getattr(self, attr)
+
+    def fset(self, value):
+        self._api_set(key, value, valid)
+
+    return property(fget, fset, doc=doc)
+
+
 class GSLB(object):
     """A Global Server Load Balancing (GSLB) service"""
 
@@ -827,7 +835,7 @@ class GSLB(object):
         """:class:`Task` for most recent system action on this :class:`GSLB`.
         """
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     def sync(self):
@@ -862,26 +870,29 @@ class GSLB(object):
                                                        api_args)
         self._build(response['data'], region=False)
 
-    @property
-    def auto_recover(self):
-        """Indicates whether or not the service should automatically come out
-        of failover when the IP addresses resume active status or if the
-        service should remain in failover until manually reset. Must be 'Y' or
-        'N'
+    def _api_set(self, key, value, valid=None):
+        """Validate *value* against the ``valid_*`` attribute named by *valid*,
+        if any, then PUT it to the DynECT System as *key* and rebuild this
+        :class:`GSLB` from the response
         """
-        return self._auto_recover
-
-    @auto_recover.setter
-    def auto_recover(self, value):
-        if value not in self.valid_auto_recover:
-            raise DynectInvalidArgumentError('auto_recover', value,
-                                             self.valid_auto_recover)
-        self._auto_recover = value
-        api_args = {'auto_recover': self._auto_recover}
+        if valid is not None:
+            valid_values = getattr(self, valid)
+            if value not in valid_values:
+                raise DynectInvalidArgumentError(key, value, valid_values)
+        setattr(self, '_' + key, value)
+        api_args = {key: value}
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'], region=False)
 
+    auto_recover = _api_field(
+        'auto_recover',
+        """Indicates whether or not the service should automatically come out
+        of failover when the IP addresses resume active status or if the
+        service should remain in failover until manually reset. Must be 'Y' or
+        'N'
+        """, valid='valid_auto_recover')
+
     @property
     def status(self):
         """The current state of the service. Will be one of 'unk', 'ok',
@@ -919,155 +930,64 @@ class GSLB(object):
         elif value in activate and not self.active:
             self.activate()
 
-    @property
-    def ttl(self):
+    ttl = _api_field(
+        'ttl',
         """Time To Live in seconds of records in the service. Must be less than
         1/2 of the Health Probe's monitoring interval. Must be one of 30, 60,
         150, 300, or 450
-        """
-        return self._ttl
-
-    @ttl.setter
-    def ttl(self, value):
-        if value not in self.valid_ttls:
-            raise DynectInvalidArgumentError('ttl', value, self.valid_ttls)
-        self._ttl = value
-        api_args = {'ttl': self._ttl}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        """, valid='valid_ttls')
 
-    @property
-    def notify_events(self):
+    notify_events = _api_field(
+        'notify_events',
         """A comma separated list of the events which trigger notifications.
         Must be one of 'ip', 'svc', or 'nosrv'
-        """
-        return self._notify_events
-
-    @notify_events.setter
-    def notify_events(self, value):
-        if value not in self.valid_notify_events:
-            raise DynectInvalidArgumentError('notify_events', value,
-                                             self.valid_notify_events)
-        self._notify_events = value
-        api_args = {'notify_events': self._notify_events}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        """, valid='valid_notify_events')
 
-    @property
-    def syslog_server(self):
+    syslog_server = _api_field(
+        'syslog_server',
         """The Hostname or IP address of a server to receive syslog
         notifications on monitoring events
-        """
-        self._get()
-        return self._syslog_server
+        """, fetch=True)
 
-    @syslog_server.setter
-    def syslog_server(self, value):
-        self._syslog_server = value
-        api_args = {'syslog_server': self._syslog_server}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_port(self):
-        """The port where the remote syslog server listens for notifications"""
-        self._get()
-        return self._syslog_port
+    syslog_port = _api_field(
+        'syslog_port',
+        """The port where the remote syslog server listens for notifications
+        """, fetch=True)
 
-    @syslog_port.setter
-    def syslog_port(self, value):
-        self._syslog_port = value
-        api_args = {'syslog_port': self._syslog_port}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_ident(self):
-        """The ident to use when sending syslog notifications"""
-        self._get()
-        return self._syslog_ident
+    syslog_ident = _api_field(
+        'syslog_ident',
+        """The ident to use when sending syslog notifications""", fetch=True)
 
-    @syslog_ident.setter
-    def syslog_ident(self, value):
-        self._syslog_ident = value
-        api_args = {'syslog_ident': self._syslog_ident}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_facility(self):
+    syslog_facility = _api_field(
+        'syslog_facility',
         """The syslog facility to use when sending syslog notifications. Must
         be one of 'kern', 'user', 'mail', 'daemon', 'auth', 'syslog', 'lpr',
         'news', 'uucp', 'cron', 'authpriv', 'ftp', 'ntp', 'security',
         'console', 'local0', 'local1', 'local2', 'local3', 'local4', 'local5',
         'local6', or 'local7'
-        """
-        self._get()
-        return self._syslog_facility
-
-    @syslog_facility.setter
-    def syslog_facility(self, value):
-        if value not in self.valid_syslog_facility:
-            raise DynectInvalidArgumentError('syslog_facility', value,
-                                             self.valid_syslog_facility)
-        self._syslog_facility = value
-        api_args = {'syslog_facility': self._syslog_facility}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_delivery(self):
-        self._get()
-        return self._syslog_delivery
-
-    @syslog_delivery.setter
-    def syslog_delivery(self, value):
-        api_args = {'syslog_delivery': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_probe_format(self):
-        self._get()
-        return self._syslog_probe_fmt
-
-    @syslog_probe_format.setter
-    def syslog_probe_format(self, value):
-        api_args = {'syslog_probe_fmt': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def syslog_status_format(self):
-        self._get()
-        return self._syslog_status_fmt
-
-    @syslog_status_format.setter
-    def syslog_status_format(self, value):
-        api_args = {'syslog_status_fmt': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
-
-    @property
-    def recovery_delay(self):
-        self._get()
-        return self._recovery_delay
-
-    @recovery_delay.setter
-    def recovery_delay(self, value):
-        api_args = {'recovery_delay': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        """, valid='valid_syslog_facility', fetch=True)
+
+    syslog_delivery = _api_field(
+        'syslog_delivery',
+        """The syslog delivery action type. 'all' will deliver notifications
+        no matter what the endpoint state. 'change' will deliver only on
+        change in the detected endpoint state
+        """, fetch=True)
+
+    syslog_probe_format = _api_field(
+        'syslog_probe_fmt',
+        """The format of syslog messages sent for probe events""", fetch=True)
+
+    syslog_status_format = _api_field(
+        'syslog_status_fmt',
+        """The format of syslog messages sent for status changes""",
+        fetch=True)
+
+    recovery_delay = _api_field(
+        'recovery_delay',
+        """The number of up status polling intervals to consider the service
+        up
+        """, fetch=True)
 
     @property
     def region(self):
@@ -1098,20 +1018,11 @@ class GSLB(object):
             self._build(response['data'], region=False)
             self._monitor = value
 
-    @property
-    def contact_nickname(self):
+    contact_nickname = _api_field(
+        'contact_nickname',
         """Name of contact to receive notifications from this :class:`GSLB`
         service
-        """
-        return self._contact_nickname
-
-    @contact_nickname.setter
-    def contact_nickname(self, value):
-        self._contact_nickname = value
-        api_args = {'contact_nickname': self._contact_nickname}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        """)
 
     def delete(self):
         """Delete this :class:`GSLB` service from the DynECT System"""
@@ -1,14 +1,32 @@
 # -*- coding: utf-8 -*-
-from dyn.compat import force_unicode
-from dyn.tm.utils import Active
+from dyn.compat import force_unicode, monotonic
+from dyn.tm.utils import Active, BatchMixin, SlotsPickleMixin
+from dyn.tm.errors import DynectGetError
 from dyn.tm.session import DynectSession
 
 __author__ = 'jnappi'
 __all__ = ['ReverseDNS']
 
+#: Lookups of services which do not exist, keyed by (customer, username, zone,
+#: fqdn, iptrack_id), mapped to the time they expire and the error message the
+#: DynECT System returned
+_missing = {}
 
-class ReverseDNS(object):
+#: The API error code returned for a service which does not exist
+_NOT_FOUND = 'NOT_FOUND'
+
+
+class ReverseDNS(BatchMixin, SlotsPickleMixin):
     """A DynECT ReverseDNS service"""
+    __slots__ = ('_zone', '_fqdn', '_hosts', '_netmask', '_ttl',
+                 '_record_types', '_iptrack_id', '_active', '_pending',
+                 '_uri_prefix', 'uri')
+    valid_record_types = ('A', 'AAAA', 'DynA', 'DynAAAA')
+
+    #: Number of seconds a failed lookup of a service is remembered for, during
+    #: which looking it up again raises the same error without an API call
+    negative_cache_ttl = 60
+
     def __init__(self, zone, fqdn, *args, **kwargs):
         """Create an new :class:`ReverseDNS` object instance
 
@@ -27,13 +45,17 @@ class ReverseDNS(object):
         super(ReverseDNS, self).__init__()
         self._zone = zone
         self._fqdn = fqdn
-        self.valid_record_types = ('A', 'AAAA', 'DynA', 'DynAAAA')
+        self._uri_prefix = '/IPTrack/{}/{}/'.format(zone, fqdn)
         self._hosts = self._netmask = self._ttl = self._record_types = None
         self._iptrack_id = self.uri = self._active = None
+        self._pending = None
         if 'api' in kwargs:
             del kwargs['api']
             for key, val in kwargs.items():
-                setattr(self, '_' + key, val)
+                if '_' + key in self.__slots__:
+                    setattr(self, '_' + key, val)
+            if self._iptrack_id is not None:
+                self.uri = '{}{}/'.format(self._uri_prefix, self._iptrack_id)
         elif len(args) + len(kwargs) == 1:
             self._get(*args, **kwargs)
         else:
@@ -55,27 +77,45 @@ class ReverseDNS(object):
                     'netmask': self._netmask}
         if ttl is not None:
             api_args['ttl'] = self._ttl
-        uri = '/IPTrack/{}/{}/'.format(self._zone, self._fqdn)
-        response = DynectSession.get_session().execute(uri, 'POST', api_args)
+        response = DynectSession.get_session().execute(self._uri_prefix,
+                                                       'POST', api_args)
         self._build(response['data'])
-        self.uri = '/IPTrack/{}/{}/{}/'.format(self._zone, self._fqdn,
-                                               self._iptrack_id)
+        self.uri = '{}{}/'.format(self._uri_prefix, self._iptrack_id)
 
     def _get(self, service_id):
         """Build an object around an existing DynECT ReverseDNS Service"""
         self._iptrack_id = service_id
-        uri = '/IPTrack/{}/{}/{}/'.format(self._zone, self._fqdn,
-                                          self._iptrack_id)
+        session = DynectSession.get_session()
+        key = (session.customer, session.username, self._zone, self._fqdn,
+               service_id)
+        missing = _missing.get(key)
+        if missing is not None:
+            if missing[0] > monotonic():
+                raise DynectGetError(missing[1])
+            _missing.pop(key, None)
+        self.uri = '{}{}/'.format(self._uri_prefix, service_id)
         api_args = {}
-        response = DynectSession.get_session().execute(uri, 'GET', api_args)
+        try:
+            response = session.execute(self.uri, 'GET', api_args)
+        except DynectGetError as e:
+            not_found = any(msg.get('ERR_CD') == _NOT_FOUND
+                            for msg in e.messages)
+            if self.negative_cache_ttl and not_found:
+                now = monotonic()
+                for stale, (expires, _) in list(_missing.items()):
+                    if expires <= now:
+                        _missing.pop(stale, None)
+                _missing[key] = (now + self.negative_cache_ttl, e.message)
+            raise
         self._build(response['data'])
-        self.uri = '/IPTrack/{}/{}/{}/'.format(self._zone, self._fqdn,
-                                               self._iptrack_id)
 
     def _update(self, api_args):
         """Update this object by making a PUT API call with the provided
-        api_args
+        api_args. Inside of a :meth:`batch` block the api_args are collected
+        instead, and sent when the block exits
         """
+        if self._defer(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -85,7 +125,7 @@ class ReverseDNS(object):
         for key, val in data.items():
             if key == 'active':
                 self._active = Active(val)
-            else:
+            elif '_' + key in self.__slots__:
                 setattr(self, '_' + key, val)
 
     @property
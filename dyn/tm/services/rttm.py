@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import time
 import warnings
+from collections import OrderedDict
 from datetime import datetime
 
-from dyn.compat import force_unicode
-from dyn.tm.utils import APIList, Active, unix_date
+from dyn.compat import force_unicode, intern_str, monotonic, string_types
+from dyn.tm.utils import (APIList, Active, BatchMixin, SlotsPickleMixin,
+                           unix_date)
 from dyn.tm.errors import DynectInvalidArgumentError
 from dyn.tm.session import DynectSession
 from dyn.tm.task import Task
@@ -13,8 +16,21 @@ __all__ = ['Monitor', 'PerformanceMonitor', 'RegionPoolEntry', 'RTTMRegion',
            'RTTM']
 
 
-class Monitor(object):
+class Monitor(BatchMixin, SlotsPickleMixin):
     """A :class:`Monitor` for RTTM Service. May be used as a HealthMonitor"""
+    __slots__ = ('_protocol', '_interval', '_retries', '_timeout', '_port',
+                 '_path', '_host', '_header', '_expected', '_status',
+                 '_pending', '_fetched', '_zone', '_fqdn', '_uri',
+                 '_json_cache')
+    _FIELD_MAP = dict((key, '_' + key) for key in (
+        'protocol', 'interval', 'retries', 'timeout', 'port', 'path', 'host',
+        'header', 'expected', 'status'))
+    # Fields drawn from a small set of values, whose strings are interned so
+    # that the many objects holding them share a single copy
+    _INTERNED = frozenset(('protocol',))
+    valid_protocols = frozenset(('HTTP', 'HTTPS', 'PING', 'SMTP', 'TCP'))
+    valid_intervals = frozenset((1, 5, 10, 15))
+    valid_timeouts = frozenset((10, 15, 25, 30))
 
     def __init__(self, protocol, interval, retries=None, timeout=None,
                  port=None, path=None, host=None, header=None, expected=None):
@@ -39,7 +55,7 @@ class Monitor(object):
             status.
         """
         super(Monitor, self).__init__()
-        self._protocol = protocol
+        self._protocol = intern_str(protocol)
         self._interval = interval
         self._retries = retries
         self._timeout = timeout
@@ -48,45 +64,46 @@ class Monitor(object):
         self._host = host
         self._header = header
         self._expected = expected
-        self.zone = self.fqdn = self._status = None
-        self.valid_protocols = ('HTTP', 'HTTPS', 'PING', 'SMTP', 'TCP')
-        self.valid_intervals = (1, 5, 10, 15)
-        self.valid_timeouts = (10, 15, 25, 30)
+        self._zone = self._fqdn = self._uri = None
+        self._status = self._pending = self._json_cache = None
+        self._fetched = False
 
     def to_json(self):
-        """Convert this :class:`HealthMonitor` object to a JSON blob"""
+        """Convert this :class:`HealthMonitor` object to a JSON blob. The blob
+        is reused until this monitor changes, so it must not be modified
+        """
+        if self._json_cache is not None:
+            return self._json_cache
         json_blob = {'protocol': self._protocol,
                      'interval': self._interval}
-        for key, val in self.__dict__.items():
-            if val is not None and not hasattr(val, '__call__') and \
-                    key.startswith('_'):
-                json_blob[key[1:]] = val
+        for key, val in (('retries', self._retries),
+                         ('timeout', self._timeout), ('port', self._port),
+                         ('path', self._path), ('host', self._host),
+                         ('header', self._header),
+                         ('expected', self._expected)):
+            if val is not None:
+                json_blob[key] = val
+        self._json_cache = json_blob
         return json_blob
 
-    def __eq__(self, other):
-        """eq override for comparing :class:`HealthMonitor` objects to JSON
-        response hashes or other :class:`DNSSECKey` instances
-
-        :param other: the value to compare this :class:`HealthMonitor` to.
-            Valid input types: `dict`, :class:`HealthMonitor`
-        """
-        if isinstance(other, dict):
-            return False
-        elif isinstance(other, Monitor):
-            return False
-        return False
-
     def _get(self):
         """Update this :class:`Monitor` with data from the Dyn System"""
-        uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
         api_args = {}
-        response = DynectSession.get_session().execute(uri, 'GET', api_args)
+        response = DynectSession.get_session().execute(self.uri, 'GET',
+                                                       api_args)
         self._build(response['data']['monitor'])
+        self._fetched = True
 
     def _update(self, api_args):
-        """Update the Dyn System with data from this :class:`Monitor`"""
-        uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
-        response = DynectSession.get_session().execute(uri, 'PUT', api_args)
+        """Update the Dyn System with data from this :class:`Monitor`. Inside
+        of a :meth:`batch` block the api_args are collected instead, and sent
+        when the block exits
+        """
+        self._json_cache = None
+        if self._defer(api_args):
+            return
+        response = DynectSession.get_session().execute(self.uri, 'PUT',
+                                                       api_args)
         self._build(response['data']['monitor'])
 
     def _build(self, data):
@@ -95,15 +112,60 @@ class Monitor(object):
 
         :param data: The 'data' field of API responses
         """
+        self._json_cache = None
+        field_map = self._FIELD_MAP
         for key, val in data.items():
-            setattr(self, '_' + key, val)
+            attr = field_map.get(key)
+            if attr is not None:
+                if key in self._INTERNED:
+                    val = intern_str(val)
+                setattr(self, attr, val)
 
     @property
-    def status(self):
-        """Get the current status of this :class:`HealthMonitor` from the
-        DynECT System
+    def uri(self):
+        """The API uri of the RTTM service this monitor belongs to"""
+        if self._uri is None:
+            self._uri = '/RTTM/{}/{}/'.format(self._zone, self._fqdn)
+        return self._uri
+
+    @property
+    def zone(self):
+        """Zone of the RTTM service this monitor belongs to"""
+        return self._zone
+
+    @zone.setter
+    def zone(self, value):
+        self._zone = value
+        self._uri = None
+
+    @property
+    def fqdn(self):
+        """FQDN of the RTTM service this monitor belongs to"""
+        return self._fqdn
+
+    @fqdn.setter
+    def fqdn(self, value):
+        self._fqdn = value
+        self._uri = None
+
+    def _merge_pending(self, api_args):
+        """Merge the fields of *api_args* into the pending changes, which
+        are nested under the type of monitor
         """
+        for key, val in api_args.items():
+            self._pending.setdefault(key, {}).update(val)
+
+    def refresh(self):
+        """Pulls data down from Dynect System and repopulates this monitor"""
         self._get()
+
+    @property
+    def status(self):
+        """The status of this :class:`HealthMonitor`, as of the first time it
+        was read or the last call to :meth:`refresh`
+        """
+        if not self._fetched:
+            self._get()
         return self._status
 
     @property
@@ -113,6 +175,8 @@ class Monitor(object):
 
     @protocol.setter
     def protocol(self, value):
+        if value == self._protocol:
+            return
         if value not in self.valid_protocols:
             raise Exception
         self._protocol = value
@@ -126,6 +190,8 @@ class Monitor(object):
 
     @interval.setter
     def interval(self, value):
+        if value == self._interval:
+            return
         if value not in self.valid_intervals:
             raise Exception
         self._interval = value
@@ -141,6 +207,8 @@ class Monitor(object):
 
     @retries.setter
     def retries(self, value):
+        if value == self._retries:
+            return
         self._retries = value
         api_args = {'monitor': {'retries': self._retries}}
         self._update(api_args)
@@ -154,6 +222,8 @@ class Monitor(object):
 
     @timeout.setter
     def timeout(self, value):
+        if value == self._timeout:
+            return
         self._timeout = value
         api_args = {'monitor': {'timeout': self._timeout}}
         self._update(api_args)
@@ -165,6 +235,8 @@ class Monitor(object):
 
     @port.setter
     def port(self, value):
+        if value == self._port:
+            return
         self._port = value
         api_args = {'monitor': {'port': self._port}}
         self._update(api_args)
@@ -176,6 +248,8 @@ class Monitor(object):
 
     @path.setter
     def path(self, value):
+        if value == self._path:
+            return
         self._path = value
         api_args = {'monitor': {'path': self._path}}
         self._update(api_args)
@@ -187,6 +261,8 @@ class Monitor(object):
 
     @host.setter
     def host(self, value):
+        if value == self._host:
+            return
         self._host = value
         api_args = {'monitor': {'host': self._host}}
         self._update(api_args)
@@ -200,6 +276,8 @@ class Monitor(object):
 
     @header.setter
     def header(self, value):
+        if value == self._header:
+            return
         self._header = value
         api_args = {'monitor': {'header': self._header}}
         self._update(api_args)
@@ -214,6 +292,8 @@ class Monitor(object):
 
     @expected.setter
     def expected(self, value):
+        if value == self._expected:
+            return
         self._expected = value
         api_args = {'monitor': {'expected': self._expected}}
         self._update(api_args)
@@ -226,31 +306,33 @@ class Monitor(object):
 
     def __bytes__(self):
         """bytes override"""
-        return bytes(self.__str__())
+        return self.__str__().encode('utf-8')
 
 
 class PerformanceMonitor(Monitor):
     """A :class:`PerformanceMonitor` for RTTM Service."""
-
-    def __init__(self, *args, **kwargs):
-        super(PerformanceMonitor, self).__init__(*args, **kwargs)
-        self.valid_intervals = (10, 20, 30, 60)
+    __slots__ = ()
+    valid_intervals = frozenset((10, 20, 30, 60))
 
     def _get(self):
         """Update this :class:`PerformanceMonitor` with data from the Dyn
         System
         """
-        uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
         api_args = {}
-        response = DynectSession.get_session().execute(uri, 'GET', api_args)
+        response = DynectSession.get_session().execute(self.uri, 'GET',
+                                                       api_args)
         self._build(response['data']['performance_monitor'])
+        self._fetched = True
 
     def _update(self, api_args):
         """Update the Dyn System with data from this
         :class:`PerformanceMonitor`
         """
-        uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
-        response = DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._json_cache = None
+        if self._defer(api_args):
+            return
+        response = DynectSession.get_session().execute(self.uri, 'PUT',
+                                                       api_args)
         self._build(response['data']['performance_monitor'])
 
     def __str__(self):
@@ -261,13 +343,23 @@ class PerformanceMonitor(Monitor):
 
     def __bytes__(self):
         """bytes override"""
-        return bytes(self.__str__())
+        return self.__str__().encode('utf-8')
 
 
-class RegionPoolEntry(object):
+class RegionPoolEntry(BatchMixin, SlotsPickleMixin):
     """Creates a new RTTM service region pool entry in the zone/node
     indicated
     """
+    __slots__ = ('_zone', '_fqdn', '_region_code', '_address', '_label',
+                 '_weight', '_serve_mode', '_status', '_log', '_task_id',
+                 '_deferred', '_dirty', '_pending', '_uri', '_fetched')
+    _FIELD_MAP = dict((key, '_' + key) for key in (
+        'zone', 'fqdn', 'region_code', 'address', 'label', 'weight',
+        'serve_mode', 'status', 'log'))
+    _INTERNED = frozenset(('region_code', 'serve_mode'))
+    _uri_fields = frozenset(('zone', 'fqdn', 'region_code', 'address'))
+    valid_modes = frozenset(('always', 'obey', 'remove', 'no'))
+    valid_weights = frozenset(range(1, 16))
 
     def __init__(self, address, label, weight, serve_mode, **kwargs):
         """Create a :class:`RegionPoolEntry` object
@@ -281,63 +373,116 @@ class RegionPoolEntry(object):
             one of 'always', 'obey', 'remove', or 'no'
         """
         super(RegionPoolEntry, self).__init__()
-        self.valid_modes = ('always', 'obey', 'remove', 'no')
         self._address = address
         self._label = label
         self._task_id = None
-        self._zone = kwargs.get('zone')
-        self._fqdn = kwargs.get('fqdn')
-        self._region_code = kwargs.get('region_code')
-        if weight not in range(1, 16):
+        self._deferred = False
+        self._dirty = {}
+        self._pending = None
+        self._uri = None
+        self._zone = kwargs.pop('zone', None)
+        self._fqdn = kwargs.pop('fqdn', None)
+        self._region_code = intern_str(kwargs.pop('region_code', None))
+        if weight not in self.valid_weights:
             raise DynectInvalidArgumentError('weight', weight, '1-15')
         self._weight = weight
         if serve_mode not in self.valid_modes:
             raise DynectInvalidArgumentError('serve_mode', serve_mode,
                                              self.valid_modes)
-        self._serve_mode = serve_mode
+        self._serve_mode = intern_str(serve_mode)
+        self._status = None
         self._log = []
+        self._fetched = False
         self._build(kwargs)
 
+    def _defer(self, api_args):
+        """Collect *api_args* for the enclosing :meth:`batch` block or, while
+        this entry is :attr:`deferred`, record them locally until its region
+        is flushed. Returns False if the changes are to be sent now
+        """
+        if super(RegionPoolEntry, self)._defer(api_args):
+            return True
+        if self._deferred:
+            self._dirty.update(api_args)
+            return True
+        return False
+
     def _update(self, args):
-        """Private method for processing various updates"""
-        uri = '/RTTMRegionPoolEntry/{}/{}/{}/{}/'.format(self._zone,
-                                                         self._fqdn,
-                                                         self._region_code,
-                                                         self._address)
-        response = DynectSession.get_session().execute(uri, 'PUT', args)
+        """Private method for processing various updates. While this entry is
+        deferred the changes are only recorded locally
+        """
+        if self._defer(args):
+            return
+        response = DynectSession.get_session().execute(self.uri, 'PUT', args)
         self._build(response['data'])
 
     def _get(self):
-        uri = '/RTTMRegionPoolEntry/{}/{}/{}/{}/'.format(self._zone,
-                                                         self._fqdn,
-                                                         self._region_code,
-                                                         self._address)
         args = {'detail': 'Y'}
-        response = DynectSession.get_session().execute(uri, 'GET', args)
+        response = DynectSession.get_session().execute(self.uri, 'GET', args)
         self._build(response['data'])
+        self._fetched = True
+
+    def refresh(self):
+        """Pulls data down from Dynect System and repopulates this
+        :class:`RegionPoolEntry`, including its logs
+        """
+        self._get()
 
     def _build(self, data):
         """Build the variables in this object by pulling out the data from data
         """
+        if 'task_id' in data:
+            # The Task itself is only built if the task property is read
+            self._task_id = data['task_id'] or None
+        field_map = self._FIELD_MAP
         for key, val in data.items():
-            if key == "task_id" and not val:
-                self._task_id = None
-            elif key == "task_id":
-                self._task_id = Task(val)
-            else:
-                setattr(self, '_' + key, val)
+            attr = field_map.get(key)
+            if attr is not None:
+                if key in self._INTERNED:
+                    val = intern_str(val)
+                setattr(self, attr, val)
+        if not self._uri_fields.isdisjoint(data):
+            self._uri = None
+
+    @property
+    def uri(self):
+        """The API uri for this :class:`RegionPoolEntry`"""
+        if self._uri is None:
+            self._uri = '/RTTMRegionPoolEntry/{}/{}/{}/{}/'.format(
+                self._zone, self._fqdn, self._region_code, self._address)
+        return self._uri
 
     @property
     def task(self):
         """:class:`Task` for most recent system
         action on this :class:`RegionPoolEntry`."""
-        if self._task_id:
-            self._task_id.refresh()
+        if not self._task_id:
+            return None
+        if not isinstance(self._task_id, Task):
+            self._task_id = Task(self._task_id)
+        self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
+    @property
+    def deferred(self):
+        """When *True*, changes to this :class:`RegionPoolEntry` are kept
+        locally instead of being sent to the DynECT System one at a time. Use
+        :meth:`RTTMRegion.flush` to send the changes of every deferred entry in
+        a region with a single request
+        """
+        return self._deferred
+
+    @deferred.setter
+    def deferred(self, value):
+        self._deferred = value
+
     @property
     def logs(self):
-        self._get()
+        """The logs of this :class:`RegionPoolEntry`, as of the first time
+        they were read or the last call to :meth:`refresh`
+        """
+        if not self._fetched:
+            self._get()
         return self._log
 
     @logs.setter
@@ -351,8 +496,13 @@ class RegionPoolEntry(object):
 
     @address.setter
     def address(self, new_address):
+        if new_address == self._address:
+            return
         api_args = {'new_address': new_address}
         self._update(api_args)
+        if self._deferred:
+            self._address = new_address
+            self._uri = None
 
     @property
     def zone(self):
@@ -363,6 +513,7 @@ class RegionPoolEntry(object):
     @zone.setter
     def zone(self, zone):
         self._zone = zone
+        self._uri = None
 
     @property
     def fqdn(self):
@@ -373,6 +524,7 @@ class RegionPoolEntry(object):
     @fqdn.setter
     def fqdn(self, fqdn):
         self._fqdn = fqdn
+        self._uri = None
 
     @property
     def region_code(self):
@@ -383,6 +535,7 @@ class RegionPoolEntry(object):
     @region_code.setter
     def region_code(self, region_code):
         self._region_code = region_code
+        self._uri = None
 
     @property
     def label(self):
@@ -391,6 +544,8 @@ class RegionPoolEntry(object):
 
     @label.setter
     def label(self, value):
+        if value == self._label:
+            return
         self._label = value
         api_args = {'label': self._label}
         self._update(api_args)
@@ -404,7 +559,9 @@ class RegionPoolEntry(object):
 
     @weight.setter
     def weight(self, new_weight):
-        if new_weight < 1 or new_weight > 15:
+        if new_weight == self._weight:
+            return
+        if new_weight not in self.valid_weights:
             raise DynectInvalidArgumentError('weight', new_weight, '1-15')
         self._weight = new_weight
         api_args = {'weight': self._weight}
@@ -417,6 +574,8 @@ class RegionPoolEntry(object):
 
     @serve_mode.setter
     def serve_mode(self, serve_mode):
+        if serve_mode == self._serve_mode:
+            return
         if serve_mode not in self.valid_modes:
             raise DynectInvalidArgumentError('serve_mode', serve_mode,
                                              self.valid_modes)
@@ -432,11 +591,7 @@ class RegionPoolEntry(object):
 
     def delete(self):
         """Delete this :class:`RegionPoolEntry`"""
-        uri = '/RTTMRegionPoolEntry/{}/{}/{}/{}/'.format(self._zone,
-                                                         self._fqdn,
-                                                         self._region_code,
-                                                         self._address)
-        DynectSession.get_session().execute(uri, 'DELETE', {})
+        DynectSession.get_session().execute(self.uri, 'DELETE', {})
 
     def __str__(self):
         """str override"""
@@ -446,11 +601,40 @@ class RegionPoolEntry(object):
 
     def __bytes__(self):
         """bytes override"""
-        return bytes(self.__str__())
+        return self.__str__().encode('utf-8')
+
 
+def _pool_entry(item):
+    """Return *item* as a :class:`RegionPoolEntry`, constructing one from it
+    if it is a `dict` of pool entry fields
+    """
+    if isinstance(item, RegionPoolEntry):
+        return item
+    return RegionPoolEntry(**item)
 
-class RTTMRegion(object):
+
+class RTTMRegion(BatchMixin, SlotsPickleMixin):
     """docstring for RTTMRegion"""
+    __slots__ = ('_zone', '_fqdn', '_region_code', '_pool', '_autopopulate',
+                 '_ep', '_apmc', '_epmc', '_serve_count', '_failover_mode',
+                 '_failover_data', '_status', '_task_id', '_pending',
+                 '_fetched', 'uri')
+    _FIELD_MAP = dict((key, '_' + key) for key in (
+        'zone', 'fqdn', 'region_code', 'autopopulate', 'ep', 'apmc', 'epmc',
+        'serve_count', 'failover_mode', 'failover_data', 'status'))
+    _INTERNED = frozenset(('region_code', 'autopopulate', 'failover_mode'))
+    valid_region_codes = frozenset(('US West', 'US Central', 'US East', 'Asia',
+                                    'EU West', 'EU Central', 'EU East',
+                                    'global'))
+    valid_modes = frozenset(('ip', 'cname', 'region', 'global'))
+    # (attribute, API key, valid values) for each optional field sent when
+    # creating a region
+    _OPTIONAL_FIELDS = (('_autopopulate', 'autopopulate', ('Y', 'N')),
+                        ('_ep', 'ep', None), ('_apmc', 'apmc', None),
+                        ('_epmc', 'epmc', None),
+                        ('_serve_count', 'serve_count', None),
+                        ('_failover_mode', 'failover_mode', valid_modes),
+                        ('_failover_data', 'failover_data', valid_modes))
 
     def __init__(self, zone, fqdn, region_code, *args, **kwargs):
         """Create a :class:`RTTMRegion` object
@@ -475,16 +659,13 @@ class RTTMRegion(object):
             'cname', 'region', or 'global'
         """
         super(RTTMRegion, self).__init__()
-        self.valid_region_codes = ('US West', 'US Central', 'US East', 'Asia',
-                                   'EU West', 'EU Central', 'EU East',
-                                   'global')
-        self.valid_modes = ('ip', 'cname', 'region', 'global')
-        self._task_id = None
+        self._task_id = self._pending = None
         self._zone = zone
         self._fqdn = fqdn
         self._autopopulate = self._ep = self._apmc = None
         self._epmc = self._serve_count = self._failover_mode = None
-        self._failover_data = None
+        self._failover_data = self._status = None
+        self._fetched = False
         if len(args) != 0:
             pool = args[0]
         else:
@@ -492,7 +673,7 @@ class RTTMRegion(object):
         if region_code not in self.valid_region_codes:
             raise DynectInvalidArgumentError('region_code', region_code,
                                              self.valid_region_codes)
-        self._region_code = region_code
+        self._region_code = intern_str(region_code)
         self._pool = []
         self.uri = '/RTTMRegion/{}/{}/{}/'.format(self._zone, self._fqdn,
                                                   self._region_code)
@@ -504,92 +685,99 @@ class RTTMRegion(object):
                           DeprecationWarning)
             pool = kwargs.pop('pool')
 
-        if not pool and len(kwargs) == 0:
+        # api=False means the caller already has this region's data from the
+        # DynECT System, so there is nothing to fetch even if it is empty
+        api = kwargs.pop('api', True)
+        if api and not pool and len(kwargs) == 0:
             self._get()
         if len(kwargs) > 0:
             self._build(kwargs)
         if pool:
-            for poole in pool:
-                if isinstance(poole, dict):
-                    rpe = RegionPoolEntry(zone=self._zone,
-                                          fqdn=self._fqdn,
-                                          region_code=self._region_code,
-                                          **poole)
-                    self._pool.append(rpe)
-                else:
-                    if not poole.zone:
-                        poole.zone = self._zone
-                    if not poole.fqdn:
-                        poole.fqdn = self._fqdn
-                    if not poole.region_code:
-                        poole.region_code = self._region_code
-                    self._pool.append(poole)
-        self._status = None
+            self._pool = [self._bind(_pool_entry(item)) for item in pool]
+
+    def _bind(self, entry):
+        """Fill in any missing zone, fqdn, or region_code on *entry* from
+        this :class:`RTTMRegion` and return it
+        """
+        if not entry.zone:
+            entry.zone = self._zone
+        if not entry.fqdn:
+            entry.fqdn = self._fqdn
+        if not entry.region_code:
+            entry.region_code = self._region_code
+        return entry
 
     def _post(self):
         """Create a new :class:`RTTMRegion` on the DynECT System"""
         uri = '/RTTMRegion/{}/{}/'.format(self._zone, self._fqdn)
-        api_args = {'region_code': self._region_code,
-                    'pool': [poole.to_json() for poole in self._pool]}
-        if self._autopopulate:
-            if self._autopopulate not in ('Y', 'N'):
-                raise DynectInvalidArgumentError('autopopulate',
-                                                 self._autopopulate,
-                                                 ('Y', 'N'))
-            api_args['autopopulate'] = self._autopopulate
-        if self._ep:
-            api_args['ep'] = self._ep
-        if self._apmc:
-            api_args['apmc'] = self._apmc
-        if self._epmc:
-            api_args['epmc'] = self._epmc
-        if self._serve_count:
-            api_args['serve_count'] = self._serve_count
-        if self._failover_mode:
-            if self._failover_mode not in self.valid_modes:
-                raise DynectInvalidArgumentError('failover_mode',
-                                                 self._failover_mode,
-                                                 self.valid_modes)
-            api_args['failover_mode'] = self._failover_mode
-        if self._failover_data:
-            if self._failover_data not in self.valid_modes:
-                raise DynectInvalidArgumentError('failover_data',
-                                                 self._failover_data,
-                                                 self.valid_modes)
-            api_args['failover_data'] = self._failover_data
+        api_args = self._serialize(validate=True)
         response = DynectSession.get_session().execute(uri, 'POST', api_args)
         self._build(response['data'])
 
+    def _serialize(self, validate=False):
+        """Return this region as the JSON blob used to create it
+
+        :param validate: Whether to check the optional fields against their
+            valid values, raising a :class:`DynectInvalidArgumentError` for
+            any that are not
+        """
+        json_blob = {'region_code': self._region_code,
+                     'pool': [entry.to_json() for entry in self._pool]}
+        for attr, key, valid in self._OPTIONAL_FIELDS:
+            val = getattr(self, attr)
+            if not val:
+                continue
+            if validate and valid is not None and val not in valid:
+                raise DynectInvalidArgumentError(key, val, valid)
+            json_blob[key] = val
+        return json_blob
+
     def _get(self):
         """Get an existing :class:`RTTMRegion` object from the DynECT System"""
         api_args = {}
         response = DynectSession.get_session().execute(self.uri, 'GET',
                                                        api_args)
         self._build(response['data'])
+        self._fetched = True
+
+    def refresh(self):
+        """Pulls data down from Dynect System and repopulates this
+        :class:`RTTMRegion`
+        """
+        self._get()
 
     def _update(self, api_args):
-        """Private Update method to cut back on redundant code"""
+        """Private Update method to cut back on redundant code. Inside of a
+        :meth:`batch` block the api_args are collected instead, and sent when
+        the block exits
+        """
+        if self._defer(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
 
     def _build(self, data):
+        if 'task_id' in data:
+            # The Task itself is only built if the task property is read
+            self._task_id = data['task_id'] or None
+        field_map = self._FIELD_MAP
         for key, val in data.items():
-            if key == 'pool':
-                pass
-            elif key == "task_id" and not val:
-                self._task_id = None
-            elif key == "task_id":
-                self._task_id = Task(val)
-            else:
-                setattr(self, '_' + key, val)
+            attr = field_map.get(key)
+            if attr is not None:
+                if key in self._INTERNED:
+                    val = intern_str(val)
+                setattr(self, attr, val)
 
     @property
     def task(self):
         """:class:`Task` for most recent system
          action on this :class:`ActiveFailover`."""
-        if self._task_id:
-            self._task_id.refresh()
+        if not self._task_id:
+            return None
+        if not isinstance(self._task_id, Task):
+            self._task_id = Task(self._task_id)
+        self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     @property
@@ -602,6 +790,8 @@ class RTTMRegion(object):
 
     @autopopulate.setter
     def autopopulate(self, value):
+        if value == self._autopopulate:
+            return
         self._autopopulate = value
         api_args = {'autopopulate': self._autopopulate}
         self._update(api_args)
@@ -616,6 +806,8 @@ class RTTMRegion(object):
 
     @ep.setter
     def ep(self, value):
+        if value == self._ep:
+            return
         self._ep = value
         api_args = {'ep': self._ep}
         self._update(api_args)
@@ -629,6 +821,8 @@ class RTTMRegion(object):
 
     @apmc.setter
     def apmc(self, value):
+        if value == self._apmc:
+            return
         self._apmc = value
         api_args = {'apmc': self._apmc}
         self._update(api_args)
@@ -642,6 +836,8 @@ class RTTMRegion(object):
 
     @epmc.setter
     def epmc(self, value):
+        if value == self._epmc:
+            return
         self._epmc = value
         api_args = {'epmc': self._epmc}
         self._update(api_args)
@@ -653,6 +849,8 @@ class RTTMRegion(object):
 
     @serve_count.setter
     def serve_count(self, value):
+        if value == self._serve_count:
+            return
         self._serve_count = value
         api_args = {'serve_count': self._serve_count}
         self._update(api_args)
@@ -666,6 +864,11 @@ class RTTMRegion(object):
 
     @failover_mode.setter
     def failover_mode(self, value):
+        if value == self._failover_mode:
+            return
+        if value not in self.valid_modes:
+            raise DynectInvalidArgumentError('failover_mode', value,
+                                             self.valid_modes)
         self._failover_mode = value
         api_args = {'failover_mode': self._failover_mode}
         self._update(api_args)
@@ -680,6 +883,8 @@ class RTTMRegion(object):
 
     @failover_data.setter
     def failover_data(self, value):
+        if value == self._failover_data:
+            return
         if value not in self.valid_modes:
             raise DynectInvalidArgumentError('failover_data', value,
                                              self.valid_modes)
@@ -693,14 +898,58 @@ class RTTMRegion(object):
 
     @pool.setter
     def pool(self, value):
-        self._pool = value
-        api_args = {'pool': self._pool}
+        self.update_pool(value)
+
+    def update_pool(self, entries):
+        """Replace the IP Pool of this :class:`RTTMRegion` with *entries*
+        using a single API call
+
+        :param entries: A list of :class:`RegionPoolEntry` objects or `dict`'s
+            of pool entry fields
+        """
+        self._pool = [self._bind(_pool_entry(item)) for item in entries]
+        api_args = {'pool': [entry.to_json() for entry in self._pool]}
         self._update(api_args)
+        for entry in self._pool:
+            entry._dirty = {}
+
+    def flush(self):
+        """Send the pending changes of any deferred :class:`RegionPoolEntry`
+        in this region's pool to the DynECT System with a single API call
+        """
+        if any(entry._dirty for entry in self._pool):
+            self.update_pool(self._pool)
+
+    def fetch_pool_detailed(self):
+        """Refresh every :class:`RegionPoolEntry` in this region's pool,
+        including their logs, with a single API call rather than one call per
+        entry. Entries present on the DynECT System but not locally are added
+        to the pool
+        """
+        api_args = {'detail': 'Y'}
+        response = DynectSession.get_session().execute(self.uri, 'GET',
+                                                       api_args)
+        entries = dict((entry.address, entry) for entry in self._pool)
+        for data in response['data'].get('pool') or []:
+            entry = entries.get(data.get('address'))
+            if entry is None:
+                entry = self._bind(_pool_entry(data))
+                self._pool.append(entry)
+            else:
+                entry._build(data)
+            if 'log' in data:
+                # The detailed data is all a GET of the entry would return,
+                # so reading its logs need not fetch it again
+                entry._fetched = True
+        return self._pool
 
     @property
     def status(self):
-        """The current state of the region."""
-        self._get()
+        """The state of the region, as of when it was last retrieved from the
+        DynECT System. Use :meth:`refresh` to update it
+        """
+        if not self._fetched:
+            self._get()
         return self._status
 
     @status.setter
@@ -710,23 +959,7 @@ class RTTMRegion(object):
     @property
     def _json(self):
         """Unpack this object and return it as a JSON blob"""
-        json_blob = {'region_code': self._region_code,
-                     'pool': [entry.to_json() for entry in self._pool]}
-        if self._autopopulate:
-            json_blob['autopopulate'] = self._autopopulate
-        if self._ep:
-            json_blob['ep'] = self._ep
-        if self._apmc:
-            json_blob['apmc'] = self._apmc
-        if self._epmc:
-            json_blob['epmc'] = self._epmc
-        if self._serve_count:
-            json_blob['serve_count'] = self._serve_count
-        if self._failover_mode:
-            json_blob['failover_mode'] = self._failover_mode
-        if self._failover_data:
-            json_blob['failover_data'] = self._failover_data
-        return json_blob
+        return self._serialize()
 
     def delete(self):
         """Delete an existing :class:`RTTMRegion` object from the DynECT
@@ -742,10 +975,70 @@ class RTTMRegion(object):
 
     def __bytes__(self):
         """bytes override"""
-        return bytes(self.__str__())
+        return self.__str__().encode('utf-8')
+
+
+class RTTM(BatchMixin, SlotsPickleMixin):
+    __slots__ = ('_zone', '_fqdn', 'uri', '_auto_recover', '_ttl',
+                 '_notify_events', '_syslog_server', '_syslog_port',
+                 '_syslog_ident', '_syslog_facility', '_syslog_delivery',
+                 '_syslog_probe_fmt', '_syslog_status_fmt', '_syslog_rttm_fmt',
+                 '_recovery_delay', '_monitor', '_performance_monitor',
+                 '_contact_nickname', '_active', '_status', '_region',
+                 '_region_data', '_task_id', '_report_cache', '_last_get',
+                 '_pending', '_repr')
+    _transient_slots = ('_last_get',)
+    valid_ttls = frozenset((30, 60, 150, 300, 450))
+    valid_notify_events = frozenset(('ip', 'svc', 'nosrv'))
+    valid_syslog_facilities = frozenset((
+        'kern', 'user', 'mail', 'daemon', 'auth', 'syslog', 'lpr', 'news',
+        'uucp', 'cron', 'authpriv', 'ftp', 'ntp', 'security', 'console',
+        'local0', 'local1', 'local2', 'local3', 'local4', 'local5', 'local6',
+        'local7'))
+    _AUTO_RECOVER = frozenset(('Y', 'N'))
+    # Response fields which are simply stored on the matching attribute, any
+    # other field without a builder is ignored
+    _FIELD_MAP = dict((key, '_' + key) for key in (
+        'zone', 'auto_recover', 'ttl', 'syslog_server', 'syslog_port',
+        'syslog_ident', 'syslog_facility', 'syslog_delivery',
+        'syslog_probe_fmt', 'syslog_status_fmt', 'syslog_rttm_fmt',
+        'recovery_delay', 'contact_nickname', 'status'))
+    # (attribute, API key, valid values) for each optional field sent when
+    # creating a service
+    _POST_FIELDS = (('_auto_recover', 'auto_recover', _AUTO_RECOVER),
+                    ('_ttl', 'ttl', valid_ttls),
+                    ('_syslog_server', 'syslog_server', None),
+                    ('_syslog_port', 'syslog_port', None),
+                    ('_syslog_ident', 'syslog_ident', None),
+                    ('_syslog_facility', 'syslog_facility',
+                     valid_syslog_facilities),
+                    ('_syslog_delivery', 'syslog_delivery', None),
+                    ('_syslog_probe_fmt', 'syslog_probe_fmt', None),
+                    ('_syslog_status_fmt', 'syslog_status_fmt', None),
+                    ('_syslog_rttm_fmt', 'syslog_rttm_fmt', None),
+                    ('_recovery_delay', 'recovery_delay', None),
+                    ('_contact_nickname', 'contact_nickname', None))
+
+    #: Number of seconds report results are reused for before being requested
+    #: from the DynECT System again
+    report_cache_ttl = 300
+
+    #: RRSet reports for points in time older than this many seconds can no
+    #: longer change, and are reused until :meth:`clear_report_cache` is called
+    report_final_age = 3600
+
+    #: Maximum number of reports kept per service. The oldest report is
+    #: discarded once a new one would exceed this limit
+    report_cache_size = 128
+
+    #: Number of seconds for which the data from the last API call is reused
+    #: by property reads before this service is fetched again
+    get_ttl = 1.0
+
+    #: Number of seconds a :attr:`status` value is reused for. Status is often
+    #: polled, so it may be cached for longer than the other fields
+    status_ttl = 2.0
 
-
-class RTTM(object):
     def __init__(self, zone, fqdn, *args, **kwargs):
         """Create a :class:`RTTM` object
 
@@ -796,14 +1089,6 @@ class RTTM(object):
             consider service up
         """
         super(RTTM, self).__init__()
-        self.valid_ttls = (30, 60, 150, 300, 450)
-        self.valid_notify_events = ('ip', 'svc', 'nosrv')
-        self.valid_syslog_facilities = ('kern', 'user', 'mail', 'daemon',
-                                        'auth', 'syslog', 'lpr', 'news',
-                                        'uucp', 'cron', 'authpriv', 'ftp',
-                                        'ntp', 'security', 'console', 'local0',
-                                        'local1', 'local2', 'local3', 'local4',
-                                        'local5', 'local6', 'local7')
         self._zone = zone
         self._fqdn = fqdn
         self.uri = '/RTTM/{}/{}/'.format(self._zone, self._fqdn)
@@ -813,9 +1098,12 @@ class RTTM(object):
         self._performance_monitor = self._contact_nickname = None
         self._active = self._syslog_delivery = self._syslog_probe_fmt = None
         self._syslog_status_fmt = self._syslog_rttm_fmt = None
-        self._recovery_delay = None
+        self._recovery_delay = self._status = None
         self._region = APIList(DynectSession.get_session, 'region')
+        self._region_data = None
         self._task_id = None
+        self._report_cache = OrderedDict()
+        self._last_get = self._pending = self._repr = None
         if 'api' in kwargs:
             del kwargs['api']
             self._build(kwargs)
@@ -834,13 +1122,12 @@ class RTTM(object):
         """Create a new RTTM Service on the DynECT System"""
         self._auto_recover = auto_recover
         self._ttl = ttl
-        self._notify_events = notify_events
         self._syslog_server = syslog_server
         self._syslog_port = syslog_port
         self._syslog_ident = syslog_ident
         self._syslog_facility = syslog_facility
         self._syslog_delivery = syslog_delivery
-        self._region += region
+        self._region.bulk_update(region)
         self._monitor = monitor
         self._performance_monitor = performance_monitor
         self._contact_nickname = contact_nickname
@@ -848,44 +1135,14 @@ class RTTM(object):
         self._syslog_status_fmt = syslog_status_fmt
         self._syslog_rttm_fmt = syslog_rttm_fmt
         self._recovery_delay = recovery_delay
-        api_args = {}
-        if auto_recover:
-            if auto_recover not in ('Y', 'N'):
-                raise DynectInvalidArgumentError('auto_recover', auto_recover,
-                                                 ('Y', 'N'))
-            api_args['auto_recover'] = self._auto_recover
-        if ttl:
-            if ttl not in self.valid_ttls:
-                raise DynectInvalidArgumentError('ttl', ttl, self.valid_ttls)
-            api_args['ttl'] = self._ttl
         if notify_events:
-            for event in notify_events:
-                if event not in self.valid_notify_events:
-                    raise DynectInvalidArgumentError('notify_events', event,
-                                                     self.valid_notify_events)
-            api_args['notify_events'] = self._notify_events
-        if syslog_server:
-            api_args['syslog_server'] = self._syslog_server
-        if syslog_port:
-            api_args['syslog_port'] = self._syslog_port
-        if syslog_ident:
-            api_args['syslog_ident'] = self._syslog_ident
-        if syslog_facility:
-            if syslog_facility not in self.valid_syslog_facilities:
-                raise DynectInvalidArgumentError('syslog_facility',
-                                                 syslog_facility,
-                                                 self.valid_syslog_facilities)
-            api_args['syslog_facility'] = self._syslog_facility
-        if syslog_delivery:
-            api_args['syslog_delivery'] = self._syslog_delivery
-        if syslog_probe_fmt:
-            api_args['syslog_probe_fmt'] = self._syslog_probe_fmt
-        if syslog_status_fmt:
-            api_args['syslog_status_fmt'] = self._syslog_status_fmt
-        if syslog_rttm_fmt:
-            api_args['syslog_rttm_fmt'] = self._syslog_rttm_fmt
-        if recovery_delay:
-            api_args['recovery_delay'] = self._recovery_delay
+            self._notify_events = self._check_notify_events(notify_events)
+        self._validate_post_args()
+
+        api_args = self._post_args()
+        if notify_events:
+            # API expects a CSV string, not a list
+            api_args['notify_events'] = self.notify_events_csv
         if region:
             api_args['region'] = [reg._json for reg in self._region]
         if monitor:
@@ -893,80 +1150,169 @@ class RTTM(object):
         if performance_monitor:
             mon_args = self._performance_monitor.to_json()
             api_args['performance_monitor'] = mon_args
-        if contact_nickname:
-            api_args['contact_nickname'] = self._contact_nickname
-
-        # API expects a CSV string, not a list
-        if isinstance(self.notify_events, list):
-            api_args['notify_events'] = ','.join(self.notify_events)
 
         response = DynectSession.get_session().execute(self.uri, 'POST',
                                                        api_args)
         self._build(response['data'])
 
-    def _get(self):
-        """Build an object around an existing DynECT RTTM Service"""
+    def _validate_post_args(self):
+        """Check every field sent when creating this service against its
+        valid values, before any of the api_args are built
+        """
+        for attr, key, valid in self._POST_FIELDS:
+            val = getattr(self, attr)
+            if val and valid is not None and val not in valid:
+                raise DynectInvalidArgumentError(key, val, valid)
+
+    def _post_args(self):
+        """Return the api_args for each set field in :attr:`_POST_FIELDS`"""
+        api_args = {}
+        for attr, key, _ in self._POST_FIELDS:
+            val = getattr(self, attr)
+            if val:
+                api_args[key] = val
+        return api_args
+
+    def _get(self, ttl=None):
+        """Build an object around an existing DynECT RTTM Service. Nothing is
+        fetched if this object was built from API data less than *ttl*
+        seconds ago, which defaults to :attr:`get_ttl`
+        """
+        if ttl is None:
+            ttl = self.get_ttl
+        if self._last_get is not None and monotonic() - self._last_get < ttl:
+            return
         api_args = {}
         response = DynectSession.get_session().execute(self.uri, 'GET',
                                                        api_args)
         self._build(response['data'])
 
-    def _update(self, api_args):
-        """Perform a PUT api call using this objects data"""
+    def _update(self, api_args, fields=None):
+        """Perform a PUT api call using this objects data. Inside of a
+        :meth:`batch` block the api_args are collected instead, and sent when
+        the block exits
+
+        :param api_args: The arguments for the PUT
+        :param fields: If provided, only these fields of the response are
+            built, for calls which are known to change nothing else
+        """
+        if self._defer(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
-        self._build(response['data'])
+        if fields is None:
+            self._build(response['data'])
+        else:
+            self._build_minimal(response['data'], fields)
+
+    def _build_region(self, val):
+        """Store the region data from API *val*. The :class:`RTTMRegion`
+        objects themselves are only built if :attr:`region` is read
+        """
+        self._region_data = val
+
+    def _build_regions(self):
+        """Rebuild the :class:`RTTMRegion` list from the stored region data.
+        Regions already in the list are updated in place, so references held
+        to them stay valid
+        """
+        existing = dict((r._region_code, r) for r in self._region)
+        regions = []
+        for region in self._region_data:
+            code = region.pop('region_code', None)
+            pool = region.pop('pool', None)
+            status = region.pop('status', None)
+
+            r = existing.get(code)
+            if r is None:
+                r = RTTMRegion(self._zone, self._fqdn, code, pool, api=False,
+                               **region)
+            else:
+                r._build(region)
+                r._pool = [r._bind(_pool_entry(item)) for item in pool or ()]
+            r._status = status
+            r._fetched = status is not None
+            regions.append(r)
+        # Replace the contents in one go. Slice assignment is not one of the
+        # APIList operations which send the list to the DynECT System
+        self._region[:] = regions
+        self._region_data = None
+
+    def _build_monitor_field(self, attr, monitor_type, val):
+        """Update, or create, the monitor stored in *attr* from API *val*"""
+        monitor = getattr(self, attr)
+        if monitor is None:
+            monitor = monitor_type(val.get('protocol'), val.get('interval'))
+            setattr(self, attr, monitor)
+        monitor.zone = self._zone
+        monitor.fqdn = self._fqdn
+        monitor._build(val)
+
+    def _build_monitor(self, val):
+        self._build_monitor_field('_monitor', Monitor, val)
+
+    def _build_performance_monitor(self, val):
+        self._build_monitor_field('_performance_monitor', PerformanceMonitor,
+                                  val)
+
+    def _build_notify_events(self, val):
+        events = val.split(',')
+        # The API normally returns the compact 'ip,svc' form
+        if ' ' in val:
+            events = [item.strip() for item in events]
+        self._notify_events = tuple(events)
+
+    def _build_fqdn(self, val):
+        if val != self._fqdn:
+            self._fqdn = val
+            self._repr = None
+
+    def _build_active(self, val):
+        self._active = Active(val)
+
+    def _build_task_id(self, val):
+        # The Task itself is only built if the task property is read
+        self._task_id = val or None
+
+    # Handlers for the response fields which need more than being stored on
+    # the matching private attribute
+    _BUILDERS = {'region': _build_region, 'monitor': _build_monitor,
+                 'performance_monitor': _build_performance_monitor,
+                 'notify_events': _build_notify_events, 'fqdn': _build_fqdn,
+                 'active': _build_active, 'task_id': _build_task_id}
 
     def _build(self, data):
         """Build the neccesary substructures under this :class:`RTTM`"""
+        self._last_get = monotonic()
+        builders, field_map = self._BUILDERS, self._FIELD_MAP
         for key, val in data.items():
-            if key == 'region':
-                self._region = APIList(DynectSession.get_session, 'region')
-                for region in val:
-                    code = region.pop('region_code', None)
-                    pool = region.pop('pool', None)
-                    status = region.pop('status', None)
-
-                    r = RTTMRegion(self._zone, self._fqdn, code, pool,
-                                   **region)
-                    r._status = status
-                    self._region.append(r)
-            elif key == 'monitor':
-                if self._monitor is not None:
-                    self._monitor.zone = self._zone
-                    self._monitor.fqdn = self._fqdn
-                else:
-                    proto = val.pop('protocol', None)
-                    inter = val.pop('interval', None)
-                    self._monitor = Monitor(proto, inter, **val)
-            elif key == 'performance_monitor':
-                if self._performance_monitor is not None:
-                    self._performance_monitor.zone = self._zone
-                    self._performance_monitor.fqdn = self._fqdn
-                else:
-                    proto = val.pop('protocol', None)
-                    inter = val.pop('interval', None)
-                    self._performance_monitor = PerformanceMonitor(proto,
-                                                                   inter,
-                                                                   **val)
-            elif key == 'notify_events':
-                self._notify_events = [item.strip() for item in val.split(',')]
-            elif key == 'active':
-                self._active = Active(val)
-            elif key == "task_id" and not val:
-                self._task_id = None
-            elif key == "task_id":
-                self._task_id = Task(val)
-            else:
-                setattr(self, '_' + key, val)
-        self._region.uri = self.uri
+            builder = builders.get(key)
+            if builder is not None:
+                builder(self, val)
+            elif key in field_map:
+                setattr(self, field_map[key], val)
+
+    def _build_minimal(self, data, fields):
+        """Build only *fields* of the API response *data*"""
+        builders, field_map = self._BUILDERS, self._FIELD_MAP
+        for key in fields:
+            if key not in data:
+                continue
+            builder = builders.get(key)
+            if builder is not None:
+                builder(self, data[key])
+            elif key in field_map:
+                setattr(self, field_map[key], data[key])
 
     @property
     def task(self):
         """:class:`Task` for most recent system
          action on this :class:`ActiveFailover`."""
-        if self._task_id:
-            self._task_id.refresh()
+        if not self._task_id:
+            return None
+        if not isinstance(self._task_id, Task):
+            self._task_id = Task(self._task_id)
+        self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     def get_rrset_report(self, ts):
@@ -979,11 +1325,14 @@ class RTTM(object):
         api_args = {'zone': self._zone,
                     'fqdn': self._fqdn,
                     'ts': ts}
-        response = DynectSession.get_session().execute('/RTTMRRSetReport/',
-                                                       'POST', api_args)
-        return response['data']
+        if ts < time.time() - self.report_final_age:
+            ttl = None
+        else:
+            ttl = self.report_cache_ttl
+        return self._cached_report(('rrset', ts), ttl, '/RTTMRRSetReport/',
+                                   api_args)
 
-    def get_log_report(self, start_ts, end_ts=None):
+    def get_log_report(self, start_ts, end_ts=None, quantize=None):
         """Generates a report with information about changes to an existing
         RTTM service
 
@@ -991,30 +1340,69 @@ class RTTM(object):
             for the start of the log report
         :param end_ts: datetime.datetime instance identifying point in time
             for the end of the log report. Defaults to datetime.datetime.now()
+        :param quantize: Optional number of seconds to round end_ts down to a
+            multiple of, so that repeated calls within the same interval
+            reuse the cached report
         :return: dictionary containing log report data
         """
-        end_ts = end_ts or datetime.now()
+        end = unix_date(end_ts or datetime.now())
+        if quantize:
+            end -= end % quantize
         api_args = {'zone': self._zone,
                     'fqdn': self._fqdn,
                     'start_ts': unix_date(start_ts),
-                    'end_ts': unix_date(end_ts)}
-        response = DynectSession.get_session().execute('/RTTMLogReport/',
-                                                       'POST', api_args)
+                    'end_ts': end}
+        key = ('log', api_args['start_ts'], api_args['end_ts'])
+        return self._cached_report(key, self.report_cache_ttl,
+                                   '/RTTMLogReport/', api_args)
+
+    def _cached_report(self, key, ttl, uri, api_args):
+        """Return the report cached under *key*, requesting it from the
+        DynECT System when it is missing or older than *ttl* seconds. A *ttl*
+        of None caches the report until :meth:`clear_report_cache` is called
+        """
+        now = monotonic()
+        cached = self._report_cache.get(key)
+        if cached is not None and (cached[0] is None or cached[0] > now):
+            return cached[1]
+        response = DynectSession.get_session().execute(uri, 'POST', api_args)
+        expires = None if ttl is None else now + ttl
+        cache = self._report_cache
+        for stale in [k for k, (exp, _) in cache.items()
+                      if exp is not None and exp <= now]:
+            del cache[stale]
+        cache.pop(key, None)
+        cache[key] = (expires, response['data'])
+        while len(cache) > self.report_cache_size:
+            cache.popitem(last=False)
         return response['data']
 
+    def clear_report_cache(self):
+        """Discard all cached rrset and log reports for this service"""
+        self._report_cache.clear()
+
+    def refresh(self):
+        """Pulls data down from Dynect System and repopulates this
+        :class:`RTTM`, including its regions and monitors, with a single API
+        call
+        """
+        self._last_get = None
+        self._get()
+
+    # The only fields of the service changed by activating or deactivating it
+    _ACTIVATE_FIELDS = ('active', 'status', 'task_id')
+    # Values accepted by the active setter, and the state each one requests
+    _ACTIVE_MAP = {'Y': True, True: True, 'N': False, False: False}
+
     def activate(self):
         """Activate this RTTM Service"""
         api_args = {'activate': True}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'])
+        self._update(api_args, self._ACTIVATE_FIELDS)
 
     def deactivate(self):
         """Deactivate this RTTM Service"""
         api_args = {'deactivate': True}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'])
+        self._update(api_args, self._ACTIVATE_FIELDS)
 
     def recover(self, recoverip=None, address=None):
         """Recovers the RTTM service or a specific node IP within the service
@@ -1042,12 +1430,15 @@ class RTTM(object):
 
     @active.setter
     def active(self, value):
-        deactivate = ('N', False)
-        activate = ('Y', True)
-        if value in deactivate and self.active:
-            self.deactivate()
-        elif value in activate and not self.active:
+        desired = self._ACTIVE_MAP.get(value)
+        if desired is None:
+            # Values other than 'Y', 'N', True and False are ignored
+            return
+        current = bool(self.active)
+        if desired and not current:
             self.activate()
+        elif not desired and current:
+            self.deactivate()
 
     @property
     def auto_recover(self):
@@ -1060,9 +1451,9 @@ class RTTM(object):
 
     @auto_recover.setter
     def auto_recover(self, value):
-        if value not in ('Y', 'N'):
+        if value not in self._AUTO_RECOVER:
             raise DynectInvalidArgumentError('auto_recover', value,
-                                             ('Y', 'N'))
+                                             self._AUTO_RECOVER)
         api_args = {'auto_recover': value}
         self._update(api_args)
 
@@ -1081,27 +1472,44 @@ class RTTM(object):
         api_args = {'ttl': value}
         self._update(api_args)
 
+    def _check_notify_events(self, value):
+        """Return *value*, a list or CSV string of notify events, as a tuple
+        after validating each of its events
+        """
+        if isinstance(value, string_types):
+            value = value.split(',')
+        events = tuple(event.strip() for event in value)
+        invalid = set(events).difference(self.valid_notify_events)
+        if invalid:
+            raise DynectInvalidArgumentError('notify_events',
+                                             ','.join(sorted(invalid)),
+                                             self.valid_notify_events)
+        return events
+
     @property
     def notify_events(self):
-        """A list of events which trigger notifications. Valid values are:
-        'ip', 'svc', and 'nosrv'
+        """A tuple of events which trigger notifications. Valid values are:
+        'ip', 'svc', and 'nosrv'. May be set to a list or a CSV string
         """
         return self._notify_events
 
     @notify_events.setter
     def notify_events(self, value):
-        for val in value:
-            if val not in self.valid_notify_events:
-                raise DynectInvalidArgumentError('notify_events', val,
-                                                 self.valid_notify_events)
-        value = ','.join(value)
-        api_args = {'notify_events': value}
+        events = self._check_notify_events(value)
+        api_args = {'notify_events': ','.join(events)}
         self._update(api_args)
 
+    @property
+    def notify_events_csv(self):
+        """The events which trigger notifications as the CSV string the
+        DynECT System expects
+        """
+        return ','.join(self._notify_events or ())
+
     @property
     def status(self):
-        """Status"""
-        self._get()
+        """Status, reused for up to :attr:`status_ttl` seconds"""
+        self._get(self.status_ttl)
         return self._status
 
     @property
@@ -1210,6 +1618,8 @@ class RTTM(object):
     @property
     def region(self):
         """A list of :class:`RTTMRegion`'s"""
+        if self._region_data is not None:
+            self._build_regions()
         return self._region
 
     @region.setter
@@ -1219,6 +1629,9 @@ class RTTM(object):
                                    value)
         elif isinstance(value, APIList):
             self._region = value
+        else:
+            return
+        self._region_data = None
         self._region.uri = self.uri
 
     @property
@@ -1228,10 +1641,7 @@ class RTTM(object):
 
     @monitor.setter
     def monitor(self, value):
-        if isinstance(value, Monitor):
-            self._monitor = value
-            api_args = {'monitor': self._monitor.to_json()}
-            self._update(api_args)
+        self._set_monitor('_monitor', 'monitor', value)
 
     @property
     def performance_monitor(self):
@@ -1240,11 +1650,23 @@ class RTTM(object):
 
     @performance_monitor.setter
     def performance_monitor(self, value):
-        if isinstance(value, Monitor):
-            self._performance_monitor = value
-            api_args = {'performance_monitor':
-                        self._performance_monitor.to_json()}
-            self._update(api_args)
+        self._set_monitor('_performance_monitor', 'performance_monitor',
+                          value)
+
+    def _set_monitor(self, attr, key, value):
+        """Store the :class:`Monitor` *value* in *attr*, and send it to the
+        DynECT System as *key* unless it is identical to the current one
+        """
+        if not isinstance(value, Monitor):
+            return
+        current = getattr(self, attr)
+        setattr(self, attr, value)
+        if current is not None and current.to_json() == value.to_json():
+            value.zone = self._zone
+            value.fqdn = self._fqdn
+            return
+        api_args = {key: value.to_json()}
+        self._update(api_args)
 
     @property
     def contact_nickname(self):
@@ -1263,10 +1685,12 @@ class RTTM(object):
 
     def __str__(self):
         """str override"""
-        return force_unicode('<RTTM>: {}').format(self._fqdn)
+        if self._repr is None:
+            self._repr = force_unicode('<RTTM>: {}').format(self._fqdn)
+        return self._repr
 
     __repr__ = __unicode__ = __str__
 
     def __bytes__(self):
         """bytes override"""
-        return bytes(self.__str__())
+        return self.__str__().encode('utf-8')
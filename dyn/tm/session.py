@@ -4,21 +4,40 @@ easy access to all other functionality within the dynect library via
 methods that return various types of DynECT objects which will provide their
 own respective functionality.
 """
+import hashlib
+import os
+import time
 import warnings
 # API Libs
-from dyn.compat import force_unicode
+from dyn.compat import force_unicode, json_dumps, json_loads, monotonic
 from dyn.core import SessionEngine
 from dyn.encrypt import AESCipher
 from dyn.tm.errors import (DynectAuthError, DynectCreateError,
                            DynectUpdateError, DynectGetError,
                            DynectDeleteError, DynectQueryTimeout)
 
+# API messages are formatted as "<source>: <info>", this is the source of
+# messages about the session's login
+_LOGIN_INFO = 'login:'
+
 
 class DynectSession(SessionEngine):
     """Base object representing a DynectSession Session"""
     __metakey__ = 'bf7886ea-c61d-40df-8c7b-4241ebed0544'
-    _valid_methods = ('DELETE', 'GET', 'POST', 'PUT')
+    _valid_methods = frozenset(('DELETE', 'GET', 'POST', 'PUT'))
     uri_root = '/REST'
+    #: The error raised for a failed call, by HTTP method
+    _FAILURE_EXC = {'POST': DynectCreateError, 'GET': DynectGetError,
+                    'PUT': DynectUpdateError, 'DELETE': DynectDeleteError}
+    #: Directory in which :meth:`user_permissions_report` results are kept
+    #: between processes, such as ``~/.cache/dyn-py``. Reports are only
+    #: requested from the API every time when this is None
+    permissions_cache_dir = None
+    #: Seconds a report kept in :attr:`permissions_cache_dir` remains valid
+    permissions_cache_ttl = 3600
+    #: Seconds a session reuses a report it has already requested for a user
+    permissions_ttl = 60
+    _STR_FMT = force_unicode(': {}, {}')
 
     def __init__(self, customer, username, password, host='api.dynect.net',
                  port=443, ssl=True, api_version='current', auto_auth=True,
@@ -48,18 +67,21 @@ class DynectSession(SessionEngine):
                                             proxy_host, proxy_port,
                                             proxy_user, proxy_pass)
         self.__cipher = AESCipher(key)
+        self._auth_cache = None
+        self._permission_reports = {}
         self.extra_headers = {'API-Version': api_version}
         self.customer = customer
         self.username = username
-        self.password = self.__cipher.encrypt(password)
+        self._set_password(password)
         self.connect()
         if auto_auth:
             self.authenticate()
 
     def __enter__(self):
-        """Yield this instance as a reference for use within the context block
+        """Return this instance as a reference for use within the context
+        block
         """
-        yield self
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """We don't particularly care about any exceptions that occured within
@@ -72,15 +94,24 @@ class DynectSession(SessionEngine):
         """Accessible method for subclass to encrypt with existing AESCipher"""
         return self.__cipher.encrypt(data)
 
+    def _set_password(self, password):
+        """Store *password* encrypted for the current customer and user. The
+        plaintext is kept in the auth cache, so authenticating straight after
+        does not need to decrypt it again
+        """
+        self.password = self.__cipher.encrypt(password)
+        self.__cache_auth_data(password)
+
     def _handle_error(self, uri, method, raw_args):
         """Handle the processing of a connection error with the api"""
-        # Need to force a re-connect on next execute
+        # Drop the failed socket, the connection opens a new one (resuming
+        # the TLS session) when the next request is sent
         self._conn.close()
-        self._conn.connect()
 
         try:
             session_check = self.execute('/REST/Session/', 'GET')
-            renew_token = 'login:' in session_check['msgs'][0]['INFO']
+            info = session_check['msgs'][0].get('INFO', '')
+            renew_token = info.startswith(_LOGIN_INFO)
         except DynectGetError:
             renew_token = True
 
@@ -88,7 +119,7 @@ class DynectSession(SessionEngine):
             # Our token is no longer valid because our session was killed
             self._token = None
             # Need to get a new Session token
-            self.execute('/REST/Session/', 'POST', self.__auth_data)
+            self.authenticate()
 
         # Then try the current call again and Specify final as true so
         # if we fail again we can raise the actual error
@@ -109,16 +140,10 @@ class DynectSession(SessionEngine):
             return response
         elif status == 'failure':
             msgs = response['msgs']
-            if method == 'POST' and 'login' in msgs[0]['INFO']:
-                raise DynectAuthError(response['msgs'])
-            if method == 'POST':
-                raise DynectCreateError(response['msgs'])
-            elif method == 'GET':
-                raise DynectGetError(response['msgs'])
-            elif method == 'PUT':
-                raise DynectUpdateError(response['msgs'])
-            else:
-                raise DynectDeleteError(response['msgs'])
+            if method == 'POST' and \
+                    msgs[0].get('INFO', '').startswith(_LOGIN_INFO):
+                raise DynectAuthError(msgs)
+            raise self._FAILURE_EXC.get(method, DynectDeleteError)(msgs)
         else:  # Status was incomplete
             job_id = response['job_id']
             if not final:
@@ -135,7 +160,8 @@ class DynectSession(SessionEngine):
         uri = '/Password/'
         api_args = {'password': new_password}
         self.execute(uri, 'PUT', api_args)
-        self.password = self.__cipher.encrypt(new_password)
+        self._set_password(new_password)
+        self._permission_reports.clear()
 
     def user_permissions_report(self, user_name=None):
         """Returns information regarding the requested user's permission access
@@ -145,14 +171,67 @@ class DynectSession(SessionEngine):
         """
         api_args = dict()
         api_args['user_name'] = user_name or self.username
-        uri = '/UserPermissionReport/'
-        response = self.execute(uri, 'POST', api_args)
-        permissions = []
-        for key, val in response['data'].items():
-            if key == 'allowed':
-                for permission in val:
-                    permissions.append(permission['name'])
-        return permissions
+        # Keyed by token as well, so reports are requested again after
+        # authenticating
+        key = (self._token, api_args['user_name'])
+        report = self._permission_reports.get(key)
+        if report is not None and \
+                monotonic() - report[0] < self.permissions_ttl:
+            return list(report[1])
+        path = self._permissions_cache_path(api_args['user_name'])
+        permissions = None
+        if path is not None:
+            permissions = self._load_permissions(path)
+        if permissions is None:
+            uri = '/UserPermissionReport/'
+            response = self.execute(uri, 'POST', api_args)
+            allowed = response['data'].get('allowed', ())
+            permissions = [permission['name'] for permission in allowed]
+            if path is not None:
+                self._store_permissions(path, permissions)
+        self._permission_reports[key] = (monotonic(), permissions)
+        return list(permissions)
+
+    def _permissions_cache_path(self, user_name):
+        """Return the file a permissions report for *user_name* is kept in,
+        or None when reports are not kept on disk
+        """
+        if self.permissions_cache_dir is None:
+            return None
+        key = '{}/{}/{}'.format(self.host, self.customer, user_name)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(os.path.expanduser(self.permissions_cache_dir),
+                            'perms_{}.json'.format(digest))
+
+    def _load_permissions(self, path):
+        """Return the permissions stored at *path*, or None if there are none
+        or they are older than :attr:`permissions_cache_ttl`
+        """
+        try:
+            if time.time() - os.path.getmtime(path) > \
+                    self.permissions_cache_ttl:
+                return None
+            with open(path, 'rb') as cache_file:
+                return json_loads(cache_file.read())
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _store_permissions(self, path, permissions):
+        """Write *permissions* to *path*. Failing to do so only means the
+        report is requested again next time, so errors are logged and ignored
+        """
+        data = json_dumps(permissions)
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        try:
+            directory = os.path.dirname(path)
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            with open(path, 'wb') as cache_file:
+                cache_file.write(data)
+        except (IOError, OSError) as err:
+            self.logger.warning('Unable to cache permissions in %s: %s',
+                                path, err)
 
     @property
     def permissions(self):
@@ -169,11 +248,8 @@ class DynectSession(SessionEngine):
         """Authenticate to the DynectSession service with the provided
         credentials
         """
-        api_args = {'customer_name': self.customer, 'user_name': self.username,
-                    'password': self.__cipher.decrypt(self.password)}
-
         try:
-            response = self.execute('/Session/', 'POST', api_args)
+            response = self.execute('/Session/', 'POST', self.__auth_data)
         except IOError:
             raise DynectAuthError('Unable to access the API host')
         if response['status'] != 'success':
@@ -184,20 +260,39 @@ class DynectSession(SessionEngine):
 
     def log_out(self):
         """Log the current session out from the DynECT API system"""
-        self.execute('/Session/', 'DELETE', {})
+        self.execute('/Session/', 'DELETE')
+        self._permission_reports.clear()
         self.close_session()
 
     @property
     def __auth_data(self):
-        """A dict of the authdata required to authenticate as this user"""
-        return {'customer_name': self.customer, 'user_name': self.username,
-                'password': self.__cipher.decrypt(self.password)}
+        """A dict of the authdata required to authenticate as this user. The
+        password is only decrypted again once the credentials have changed
+        """
+        creds = (self.customer, self.username, self.password)
+        if self._auth_cache is None or self._auth_cache[0] != creds:
+            self.__cache_auth_data(self.__cipher.decrypt(self.password))
+        return self._auth_cache[1]
+
+    def __cache_auth_data(self, password):
+        """Cache the authdata for the current credentials, whose decrypted
+        password is *password*
+        """
+        creds = (self.customer, self.username, self.password)
+        auth_data = {'customer_name': self.customer,
+                     'user_name': self.username, 'password': password}
+        self._auth_cache = (creds, auth_data)
+
+    def __getstate__(self):
+        """Never pickle the decrypted credentials held in the auth cache"""
+        d = super(DynectSession, self).__getstate__()
+        d['_auth_cache'] = None
+        return d
 
     def __str__(self):
         """str override"""
         header = super(DynectSession, self).__str__()
-        return header + force_unicode(': {}, {}').format(self.customer,
-                                                         self.username)
+        return header + self._STR_FMT.format(self.customer, self.username)
 
 
 class DynectMultiSession(DynectSession):
@@ -207,7 +302,8 @@ class DynectMultiSession(DynectSession):
                  key=None, history=False, proxy_host=None, proxy_port=None,
                  proxy_user=None, proxy_pass=None):
 
-        self._open_sessions = []
+        # Open sessions keyed by (customer_name, user_name)
+        self._open_sessions = {}
 
         super(DynectMultiSession, self).__init__(customer, username,
                                                  password, host=host,
@@ -221,63 +317,41 @@ class DynectMultiSession(DynectSession):
                                                  proxy_pass=proxy_pass)
         self.__add_open_session()
 
-    def _handle_error(self, uri, method, raw_args):
-        """Handle the processing of a connection error with the api"""
-
-        # Need to force a re-connect on next execute
-        self._conn.close()
-        self._conn.connect()
-
-        try:
-            session_check = self.execute('/REST/Session/', 'GET')
-            renew_token = 'login:' in session_check['msgs'][0]['INFO']
-        except DynectGetError:
-            renew_token = True
-
-        if renew_token:
-            # Our token is no longer valid because our session was killed
-            self._token = None
-            # Need to get a new Session token
-            self.authenticate()
-
-        # Then try the current call again and Specify final as true so
-        # if we fail again we can raise the actual error
-        return self.execute(uri, method, raw_args, final=True)
-
     def __add_open_session(self):
         """Add new open session to hash of open sessions"""
-        # Blow away any sessions of the same user/customer.
-        self._open_sessions = [x for x in self._open_sessions
-                               if x['user_name'] != self.username or
-                               x['customer_name'] != self.customer]
-        self._open_sessions.append({
+        key = (self.customer, self.username)
+        session = self._open_sessions.get(key)
+        if session is not None:
+            # Re-authenticating, _set_password keeps the password current so
+            # only the token can differ
+            session['token'] = self._token
+            return
+        self._open_sessions[key] = {
             'user_name': self.username,
             'password': self.password,
             'customer_name': self.customer,
             'token': self._token
-        })
+        }
 
     @property
     def get_open_sessions(self):
-        return self._open_sessions
+        return list(self._open_sessions.values())
 
     def set_active_session(self, username, customer=None):
         """Set the active session from the hash of open sessions"""
-        candidate_session = [open_session for open_session
-                             in self._open_sessions
-                             if open_session['user_name'] == username]
         if customer:
-            candidate_session = [c_session for c_session
-                                 in candidate_session
-                                 if c_session['customer_name'] == customer]
+            open_session = self._open_sessions.get((customer, username))
+            candidate_session = [open_session] if open_session else []
+        else:
+            candidate_session = [open_session for open_session
+                                 in self._open_sessions.values()
+                                 if open_session['user_name'] == username]
         if len(candidate_session) > 1:
             raise Exception("Could not sensibly determine what to set to\
              active. Try Specifying the customer")
         elif len(candidate_session) == 1:
-            self.username = candidate_session[0]['user_name']
-            self.password = candidate_session[0]['password']
-            self.customer = candidate_session[0]['customer_name']
-            self._token = candidate_session[0]['token']
+            self._switch_token(candidate_session[0])
+            self._permission_reports.clear()
             self.authenticate()
 
         else:
@@ -289,6 +363,25 @@ class DynectMultiSession(DynectSession):
                 raise ValueError("No open sessions for user {0}".format(
                     username))
 
+    def _set_password(self, password):
+        """Store *password* for the current customer and user, and for their
+        open session if they have one, so switching back to that session
+        authenticates with the new password
+        """
+        super(DynectMultiSession, self)._set_password(password)
+        session = self._open_sessions.get((self.customer, self.username))
+        if session is not None:
+            session['password'] = self.password
+
+    def _switch_token(self, session):
+        """Make the open *session* the active one, using its stored token
+        as is rather than authenticating again
+        """
+        self.username = session['user_name']
+        self.password = session['password']
+        self.customer = session['customer_name']
+        self._token = session['token']
+
     def new_user_session(self, customer, username, password):
         """Authenticate a new user"""
         if not self._open_sessions:
@@ -298,7 +391,7 @@ class DynectMultiSession(DynectSession):
         original_customer = self.customer
         self.customer = customer
         self.username = username
-        self.password = self._encrypt(password)
+        self._set_password(password)
         self._token = None
         try:
             self.authenticate()
@@ -325,12 +418,13 @@ class DynectMultiSession(DynectSession):
         if len(self._open_sessions) == 1:
             self.log_out()
             return
-        self.execute('/Session/', 'DELETE', {})
-        self._open_sessions[:] = (s for s in self._open_sessions
-                                  if s['user_name'] != self.username or
-                                  s['customer_name'] != self.customer)
+        self.execute('/Session/', 'DELETE')
+        self._permission_reports.clear()
+        self._open_sessions.pop((self.customer, self.username), None)
         if len(self._open_sessions) == 1:
-            self.set_active_session(self._open_sessions[0]['user_name'])
+            session = next(iter(self._open_sessions.values()))
+            self.set_active_session(session['user_name'],
+                                    customer=session['customer_name'])
         elif len(self._open_sessions) > 1:
             warnings.warn("More than one active session remains,\
                            could not reliably fall back to a \
@@ -341,10 +435,20 @@ class DynectMultiSession(DynectSession):
 
     def log_out(self):
         """Log the current session(s) out from the DynECT API system"""
-        for session in self._open_sessions:
-            self.set_active_session(session['user_name'],
-                                    customer=session['customer_name'])
-            self.execute('/Session/', 'DELETE', {})
+        # Iterate over a snapshot, a connection error while logging out can
+        # re-authenticate and so register a session
+        for session in tuple(self._open_sessions.values()):
+            # Each stored token is logged out directly, authenticating first
+            # would only open another session to close
+            self._switch_token(session)
+            try:
+                self.execute('/Session/', 'DELETE')
+            except DynectDeleteError:
+                # The token had already expired
+                self.logger.debug('Session for %s/%s was already closed',
+                                  session['customer_name'],
+                                  session['user_name'])
+        self._permission_reports.clear()
         self.close_session()
-        self._open_sessions = []
+        self._open_sessions = {}
         self.username = self.password = self.customer = self._token = None
@@ -2,21 +2,41 @@
 """This module contains interfaces for all Task management features of the
 REST API
 """
-from dyn.compat import force_unicode
-from dyn.tm.session import DynectSession
+from dyn.compat import force_unicode, intern_str, monotonic
+from dyn.tm.utils import SlotsPickleMixin
 
 __author__ = 'mhowes'
 
 
 def get_tasks():
-    response = DynectSession.get_session().execute('/Task', 'GET',
-                                                   {})
+    from dyn.tm.session import DynectSession
+    response = DynectSession.get_session().execute('/Task', 'GET')
     return [Task(task.pop('task_id'), api=False, **task)
             for task in response['data']]
 
 
-class Task(object):
+class Task(SlotsPickleMixin):
     """A class representing a DynECT Task"""
+    # get_tasks() can return thousands of these, so they carry no __dict__
+    __slots__ = ('_task_id', '_blocking', '_created_ts', '_customer_name',
+                 '_debug', '_message', '_modified_ts', '_name', '_status',
+                 '_step_count', '_total_steps', '_zone_name', '_args',
+                 '_last_refresh', 'uri')
+    _transient_slots = ('_last_refresh',)
+    _FIELD_MAP = dict((key, '_' + key) for key in (
+        'task_id', 'blocking', 'created_ts', 'customer_name', 'debug',
+        'message', 'modified_ts', 'name', 'status', 'step_count',
+        'total_steps', 'zone_name'))
+    # Fields repeated across most tasks of an account, whose strings are
+    # interned so that a large task list shares a single copy of each
+    _INTERNED = frozenset(('blocking', 'customer_name', 'name', 'status'))
+    # Converted once rather than on every call to __str__, which runs for
+    # each task whenever a task list is logged
+    _STR_FMT = force_unicode('<Task>: {} - {} - {} - {} - {}')
+    #: Number of seconds the ``task`` properties of services reuse a fetched
+    #: :class:`Task` for before refreshing it again
+    refresh_ttl = 0.5
+
     def __init__(self, task_id, *args, **kwargs):
         super(Task, self).__init__()
         self._task_id = task_id
@@ -26,7 +46,7 @@ class Task(object):
         self._name = self._status = None
         self._step_count = None
         self._total_steps = self._zone_name = None
-        self._args = None
+        self._args = self._last_refresh = None
 
         if 'api' in kwargs:
             del kwargs['api']
@@ -36,17 +56,27 @@ class Task(object):
 
     def _build(self, data):
         """Build this object from the data returned in an API response"""
+        self._last_refresh = monotonic()
+        field_map = self._FIELD_MAP
         for key, val in data.items():
-            if key == 'args':
-                self._args = [{varg['name']: varg['value']}
-                              for varg in val]
-            else:
-                setattr(self, '_' + key, val)
+            attr = field_map.get(key)
+            if attr is not None:
+                if key in self._INTERNED:
+                    val = intern_str(val)
+                setattr(self, attr, val)
+            elif key == 'args':
+                # Kept as returned, most tasks listed by get_tasks() never
+                # have their args read
+                self._args = val
 
     @property
     def args(self):
-        """Returns List of args, and their value"""
-        return self._args
+        """Returns List of args, and their value, as one single item
+        ``{name: value}`` dict per arg
+        """
+        if self._args is None:
+            return None
+        return [{varg['name']: varg['value']} for varg in self._args]
 
     @property
     def blocking(self):
@@ -108,25 +138,29 @@ class Task(object):
         """Returns Zone name for this task"""
         return self._zone_name
 
-    def refresh(self):
-        """Updates :class:'Task' with current data on system. """
-        api_args = dict()
-        response = DynectSession.get_session().execute(self.uri, 'GET',
-                                                       api_args)
+    def refresh(self, max_age=None):
+        """Updates :class:'Task' with current data on system.
+
+        :param max_age: If provided, nothing is fetched when this
+            :class:`Task` was updated less than *max_age* seconds ago
+        """
+        if max_age is not None and self._last_refresh is not None and \
+                monotonic() - self._last_refresh < max_age:
+            return
+        from dyn.tm.session import DynectSession
+        response = DynectSession.get_session().execute(self.uri, 'GET')
         self._build(response['data'])
 
     def cancel(self):
         """Cancels Task"""
-        api_args = dict()
-        response = DynectSession.get_session().execute(self.uri, 'DELETE',
-                                                       api_args)
+        from dyn.tm.session import DynectSession
+        response = DynectSession.get_session().execute(self.uri, 'DELETE')
 
         self._build(response['data'])
 
     def __str__(self):
-        return force_unicode('<Task>: {} - {} - {} - {} - {}').format(
-                             self._task_id, self._zone_name,
-                             self._name, self._message, self._status)
+        return self._STR_FMT.format(self._task_id, self._zone_name,
+                                    self._name, self._message, self._status)
 
     __repr__ = __unicode__ = __str__
 
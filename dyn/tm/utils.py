@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """This module contains utilities to be used throughout the dyn.tm module"""
 import calendar
+from contextlib import contextmanager
 
 from dyn.compat import string_types, force_unicode
 
 __author__ = 'jnappi'
-__all__ = ['unix_date', 'APIList', 'Active']
+__all__ = ['unix_date', 'SlotsPickleMixin', 'BatchMixin', 'APIList',
+           'Active']
 
 
 def unix_date(date):
@@ -13,7 +15,97 @@ def unix_date(date):
     return calendar.timegm(date.timetuple())
 
 
-class APIList(list):
+class SlotsPickleMixin(object):
+    """Mixin which lets classes using ``__slots__``, and so having no
+    ``__dict__``, be pickled with every pickle protocol
+    """
+    __slots__ = ()
+
+    #: Slots which only have meaning in the current process, such as
+    #: monotonic timestamps, and are reset to None when unpickled
+    _transient_slots = ()
+
+    def __getstate__(self):
+        """Return the slot values of this object for pickling"""
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        for name in self._transient_slots:
+            state[name] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restore the slot values of this object when unpickling"""
+        for name, val in state.items():
+            setattr(self, name, val)
+
+
+class BatchMixin(object):
+    """Mixin for API objects whose changes can be collected in a :meth:`batch`
+    block and sent to the DynECT System in a single API call. Classes using
+    it keep the collected changes in a ``_pending`` attribute, which is None
+    outside of a batch, and call :meth:`_defer` at the start of their
+    ``_update`` method
+    """
+    __slots__ = ()
+
+    def _defer(self, api_args):
+        """Merge *api_args* into the changes pending for the enclosing
+        :meth:`batch` block. Returns False if there is no such block
+        """
+        if self._pending is None:
+            return False
+        self._merge_pending(api_args)
+        return True
+
+    def _merge_pending(self, api_args):
+        """Add *api_args* to the pending changes. activate and deactivate
+        cancel each other out, so the last one made takes effect
+        """
+        if 'activate' in api_args:
+            self._pending.pop('deactivate', None)
+        if 'deactivate' in api_args:
+            self._pending.pop('activate', None)
+        self._pending.update(api_args)
+
+    @contextmanager
+    def batch(self):
+        """Context manager which collects the changes made to this object
+        within the ``with`` block and sends them to the DynECT System in a
+        single API call when the block exits. Nested blocks join the
+        outermost one, and nothing is sent if the block raises::
+
+            >>> with service.batch():
+            ...     service.ttl = 60
+            ...     service.activate()
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = {}
+        try:
+            yield self
+            pending = self._pending
+        finally:
+            self._pending = None
+        if pending:
+            self._update(pending)
+
+    def update(self, **changes):
+        """Update several fields of this object with a single API call. Each
+        value is validated exactly as it would be by the matching property
+        setter
+
+        :param changes: The fields to change, and their new values
+        """
+        with self.batch():
+            for key, val in changes.items():
+                setattr(self, key, val)
+
+
+class APIList(BatchMixin, list):
     """Custom API List type. All objects in this list are assumed to have a
     _json property, ensuring that they are JSON serializable
     """
@@ -33,6 +125,28 @@ class APIList(list):
         self.session_func = session_func
         self.name = name
         self.uri = uri
+        self._pending = None
+        self._batches = []
+
+    def __enter__(self):
+        """Defer the PUT normally made by each modification of this list until
+        the outermost ``with`` block exits, at which point the full list is
+        sent in a single API call. Equivalent to :meth:`batch`
+        """
+        batch = self.batch()
+        self._batches.append(batch)
+        return batch.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Send any deferred changes, unless the block raised"""
+        return self._batches.pop().__exit__(exc_type, exc_val, exc_tb)
+
+    def __reduce__(self):
+        """Pickle this list through its constructor. Restoring the items one
+        at a time would make an API call for each of them
+        """
+        return (self.__class__,
+                (self.session_func, self.name, self.uri, list(self)))
 
     def __add__(self, item):
         """Handle the addition of an item to this list via an API Call"""
@@ -77,6 +191,16 @@ class APIList(list):
         self._update(self.__build_args())
         return response
 
+    def bulk_update(self, iterable):
+        """Replace the contents of this list with *iterable* using a single
+        API call
+
+        :param iterable: The new items for this list
+        """
+        with self.batch():
+            super(APIList, self).__setitem__(slice(None), list(iterable))
+            self._update(self.__build_args())
+
     def __build_args(self):
         """Convert this list into an API Args dict"""
         my_list = [x._json for x in self if x is not None]
@@ -84,11 +208,16 @@ class APIList(list):
 
     def _update(self, api_args):
         """Private update (PUT) method"""
+        if self._defer(api_args):
+            return
         if self.session_func is not None and self.uri is not None:
             response = self.session_func().execute(self.uri, 'PUT', api_args)
             data = response['data'][self.name]
             for new_data, item in zip(data, self):
-                item._update(new_data)
+                # Items which make their own PUT in _update are rebuilt from
+                # the response instead, so the list is written only once
+                build = getattr(item, '_build', None) or item._update
+                build(new_data)
 
     def __delitem__(self, key):
         """Handle the deletion of an entry in this list via an API call"""
@@ -377,7 +377,7 @@ class Zone(object):
         """:class:`Task` for most recent system action on this :class:`Zone`.
         """
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     def get_notes(self, offset=None, limit=None):
@@ -843,7 +843,7 @@ class SecondaryZone(object):
          on this :class:`SecondaryZone`.
         """
         if self._task_id:
-            self._task_id.refresh()
+            self._task_id.refresh(max_age=Task.refresh_ttl)
         return self._task_id
 
     @property
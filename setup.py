@@ -29,5 +29,6 @@ setup(
         'Topic :: Software Development :: Libraries', 
     ],
     install_requires=requires,
+    extras_require={'orjson': ['orjson']},
     tests_require=tests_requires,
 )